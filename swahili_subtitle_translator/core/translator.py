@@ -4,22 +4,56 @@ Subtitle Translation Engine
 Advanced subtitle translation with multiple service support, caching, and error handling.
 """
 
+import re
 import time
 import logging
 import hashlib
+from contextlib import nullcontext
+from functools import lru_cache
 from typing import Optional, Dict, List, Any
 from pathlib import Path
 import json
 
-from deep_translator import GoogleTranslator, MyMemoryTranslator
-from deep_translator.exceptions import TranslationNotFound, TooManyRequests, RequestError
-
 from ..utils.cache import TranslationCache
-from ..utils.exceptions import TranslationError, UnsupportedLanguageError
+from ..utils.rate_limit import TokenBucket
+from ..utils.exceptions import TranslationError, RateLimitError, UnsupportedLanguageError
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _make_cache_key(source_lang: str, target_lang: str, text: str) -> str:
+    """Build the cache key for a language pair and text."""
+    combined = f"{source_lang}:{target_lang}:{text}"
+    return hashlib.blake2b(combined.encode(), digest_size=16).hexdigest()
+
+
+# Common English->Swahili adaptations
+ADAPTATIONS = {
+    'Your Grace': 'Neema yako',
+    'My Lord': 'Bwana wangu',
+    'My Lady': 'Bibi wangu',
+    'Your Majesty': 'Mfalme wangu',
+    'the North': 'Kaskazini',
+    'the South': 'Kusini',
+    'Winter is coming': 'Baridi inakuja'
+}
+
+_ADAPTATION_LOOKUP = {eng.lower(): swa for eng, swa in ADAPTATIONS.items()}
+_ADAPTATION_PATTERN = re.compile(
+    r'\b(?:' + '|'.join(re.escape(eng) for eng in ADAPTATIONS) + r')\b', re.IGNORECASE
+)
+
+# Sentence and clause boundaries used to split long text
+_SENTENCE_SPLIT_PATTERN = re.compile(r'(?<=[.!?])\s+')
+_CLAUSE_SPLIT_PATTERN = re.compile(r'(?<=,)\s*')
+_LINE_BREAK_PATTERN = re.compile(r'\s*\n\s*')
+
+# Lines without letters, or made only of formatting tags, are left as-is
+_LETTER_PATTERN = re.compile(r'[^\W\d_]')
+_TAG_ONLY_PATTERN = re.compile(r'(?:<[^>]+>\s*)+')
+
+
 class TranslationService:
     """Translation service interface."""
     
@@ -37,19 +71,28 @@ class GoogleTranslationService(TranslationService):
     
     def __init__(self, source: str = 'en', target: str = 'sw'):
         super().__init__(source, target)
+        # deep-translator is imported lazily to keep package import fast
+        from deep_translator import GoogleTranslator
+        from deep_translator.exceptions import TooManyRequests, RequestError
+        
         self.translator = GoogleTranslator(source=source, target=target)
+        self._rate_limit_error = TooManyRequests
+        self._service_errors = RequestError
         self.rate_limit_delay = 0.1
+        self.rate_limiter = TokenBucket(rate=1 / self.rate_limit_delay, capacity=5)
     
     def translate(self, text: str) -> str:
         """Translate text using Google Translate."""
-        if not text.strip():
+        if not text or text.isspace():
             return text
         
         try:
-            result = self.translator.translate(text.strip())
-            time.sleep(self.rate_limit_delay)  # Rate limiting
-            return result
-        except (TooManyRequests, RequestError) as e:
+            self.rate_limiter.acquire()
+            return self.translator.translate(text)
+        except self._rate_limit_error as e:
+            logger.warning(f"Google Translate rate limited: {e}")
+            raise RateLimitError(f"Translation service rate limited: {e}")
+        except self._service_errors as e:
             logger.warning(f"Google Translate request failed: {e}")
             raise TranslationError(f"Translation service unavailable: {e}")
         except Exception as e:
@@ -62,18 +105,25 @@ class MyMemoryTranslationService(TranslationService):
     
     def __init__(self, source: str = 'en', target: str = 'sw'):
         super().__init__(source, target)
+        from deep_translator import MyMemoryTranslator
+        from deep_translator.exceptions import TooManyRequests
+        
         self.translator = MyMemoryTranslator(source=source, target=target)
+        self._rate_limit_error = TooManyRequests
         self.rate_limit_delay = 0.2
+        self.rate_limiter = TokenBucket(rate=1 / self.rate_limit_delay, capacity=5)
     
     def translate(self, text: str) -> str:
         """Translate text using MyMemory."""
-        if not text.strip():
+        if not text or text.isspace():
             return text
         
         try:
-            result = self.translator.translate(text.strip())
-            time.sleep(self.rate_limit_delay)  # Rate limiting
-            return result
+            self.rate_limiter.acquire()
+            return self.translator.translate(text)
+        except self._rate_limit_error as e:
+            logger.warning(f"MyMemory rate limited: {e}")
+            raise RateLimitError(f"MyMemory rate limited: {e}")
         except Exception as e:
             logger.warning(f"MyMemory translation failed: {e}")
             raise TranslationError(f"MyMemory translation failed: {e}")
@@ -145,6 +195,7 @@ class SubtitleTranslator:
         
         self.primary_service = primary_service
         self.fallback_services = [s for s in self.services.keys() if s != primary_service]
+        self._service_order = (primary_service, *self.fallback_services)
         
         # Initialize cache
         if enable_cache:
@@ -158,29 +209,37 @@ class SubtitleTranslator:
             'total_translations': 0,
             'cache_hits': 0,
             'service_usage': {service: 0 for service in self.services.keys()},
-            'failed_translations': 0
+            'failed_translations': 0,
+            'duplicate_lines': 0,
+            'skipped_noop': 0
         }
         
         logger.info(f"Initialized SubtitleTranslator: {source_lang} -> {target_lang}")
     
     def _get_cache_key(self, text: str) -> str:
         """Generate cache key for text."""
-        combined = f"{self.source_lang}:{self.target_lang}:{text}"
-        return hashlib.md5(combined.encode()).hexdigest()
+        return _make_cache_key(self.source_lang, self.target_lang, text)
+    
+    def _get_cache_keys(self, texts: List[str]) -> List[str]:
+        """Generate cache keys for many texts in one pass."""
+        prefix = f"{self.source_lang}:{self.target_lang}:".encode()
+        blake2b = hashlib.blake2b
+        return [blake2b(prefix + text.encode(), digest_size=16).hexdigest() for text in texts]
     
     def _preprocess_text(self, text: str) -> str:
         """
         Preprocess text before translation.
         
         Handles special cases like character names, places, etc.
+        Receives text that has already been stripped by translate_text.
         """
         # Keep original for now, but this could be expanded for:
         # - Character name preservation
         # - Cultural context adaptation
         # - Technical term handling
-        return text.strip()
+        return text
     
-    def _postprocess_text(self, text: str, original: str) -> str:
+    def _postprocess_text(self, text: str) -> str:
         """
         Post-process translated text.
         
@@ -189,59 +248,68 @@ class SubtitleTranslator:
         # Basic post-processing - can be expanded
         processed = text.strip()
         
-        # Common English->Swahili adaptations
-        adaptations = {
-            'Your Grace': 'Neema yako',
-            'My Lord': 'Bwana wangu',
-            'My Lady': 'Bibi wangu',
-            'Your Majesty': 'Mfalme wangu',
-            'the North': 'Kaskazini',
-            'the South': 'Kusini',
-            'Winter is coming': 'Baridi inakuja'
-        }
-        
-        for eng, swa in adaptations.items():
-            if eng.lower() in original.lower():
-                processed = processed.replace(eng, swa)
-        
-        return processed
+        # Replace any English phrases the service left untranslated
+        return _ADAPTATION_PATTERN.sub(
+            lambda match: _ADAPTATION_LOOKUP[match.group(0).lower()], processed
+        )
     
-    def translate_text(self, text: str, progress_callback=None) -> str:
+    def translate_text(self, text: str, progress_callback=None, cache_key: Optional[str] = None) -> str:
         """
         Translate a single text string.
         
         Args:
             text: Text to translate
             progress_callback: Optional callback for progress updates
+            cache_key: Precomputed cache key for the stripped text
             
         Returns:
             Translated text
         """
-        if not text or not text.strip():
+        if not self.cache:
+            return self._translate_text(text, progress_callback, cache_key)
+        
+        # Written to disk when the call returns, or once by an enclosing translate_batch
+        with self.cache.batch():
+            return self._translate_text(text, progress_callback, cache_key)
+    
+    def _translate_text(self, text: str, progress_callback=None, cache_key: Optional[str] = None) -> str:
+        """Translate a single text string (see ``translate_text``)."""
+        if not text:
+            return text
+        
+        # Canonicalize once; everything below works on the stripped text
+        stripped = text.strip()
+        if not stripped:
+            return text
+        
+        # Punctuation, numbers and bare tags come back unchanged from services
+        if not _LETTER_PATTERN.search(stripped) or _TAG_ONLY_PATTERN.fullmatch(stripped):
+            self.stats['skipped_noop'] += 1
             return text
         
         self.stats['total_translations'] += 1
         
-        # Check cache first
+        # Check cache first (recent entries are answered from its in-memory tier)
         if self.cache:
-            cache_key = self._get_cache_key(text)
+            cache_key = cache_key or self._get_cache_key(stripped)
             cached = self.cache.get(cache_key)
             if cached:
                 self.stats['cache_hits'] += 1
-                logger.debug(f"Cache hit for: {text[:50]}...")
+                logger.debug(f"Cache hit for: {stripped[:50]}...")
                 return cached
         
         # Preprocess text
-        processed_text = self._preprocess_text(text)
+        processed_text = self._preprocess_text(stripped)
         
         # Handle long text by splitting into sentences (improved from original)
         if len(processed_text) > 500:
-            return self._translate_long_text(processed_text, text, progress_callback)
+            return self._translate_long_text(processed_text, text, progress_callback, cache_key)
         
         # Translate normal length text
-        return self._translate_single_text(processed_text, text, progress_callback)
+        return self._translate_single_text(processed_text, text, progress_callback, cache_key)
     
-    def _translate_long_text(self, processed_text: str, original_text: str, progress_callback=None) -> str:
+    def _translate_long_text(self, processed_text: str, original_text: str, progress_callback=None,
+                             cache_key: Optional[str] = None) -> str:
         """
         Translate long text by splitting into sentences.
         
@@ -250,94 +318,131 @@ class SubtitleTranslator:
         logger.debug(f"Translating long text ({len(processed_text)} chars): {processed_text[:50]}...")
         
         # Split by sentences - improved detection
-        sentence_delimiters = ['. ', '! ', '? ', '.\n', '!\n', '?\n']
-        sentences = [processed_text]
-        
-        for delimiter in sentence_delimiters:
-            new_sentences = []
-            for sentence in sentences:
-                new_sentences.extend(sentence.split(delimiter))
-            sentences = [s.strip() for s in new_sentences if s.strip()]
+        sentences = [s for s in _SENTENCE_SPLIT_PATTERN.split(processed_text) if s]
         
         if len(sentences) <= 1:
             # Fallback: split by punctuation if no sentences found
-            sentences = [s.strip() for s in processed_text.split(',') if s.strip()]
+            sentences = [s for s in _CLAUSE_SPLIT_PATTERN.split(processed_text) if s]
         
         if len(sentences) <= 1:
             # Last resort: translate as single text
-            return self._translate_single_text(processed_text, original_text, progress_callback)
+            return self._translate_single_text(processed_text, original_text, progress_callback, cache_key)
         
-        # Translate each sentence
-        translated_sentences = []
-        for i, sentence in enumerate(sentences):
-            if sentence.strip():
+        # Translate all sentences in one request, one sentence per line
+        translated_sentences = self._translate_sentences(sentences)
+        
+        if translated_sentences is None:
+            # Fall back to translating each sentence separately
+            translated_sentences = []
+            for i, sentence in enumerate(sentences):
                 logger.debug(f"Translating sentence {i+1}/{len(sentences)}: {sentence[:30]}...")
-                translated = self._translate_single_text(sentence.strip(), sentence, progress_callback)
+                translated = self._translate_single_text(sentence, sentence, progress_callback)
                 translated_sentences.append(translated)
-                # Small delay between sentence translations
-                time.sleep(0.1)
+        elif progress_callback:
+            progress_callback(len(sentences))
         
-        # Reconstruct the text with proper punctuation
-        result = '. '.join(translated_sentences)
+        # Sentences keep their own punctuation, so rejoin with plain spaces
+        result = ' '.join(translated_sentences)
         
         # Apply post-processing
-        final_result = self._postprocess_text(result, original_text)
+        final_result = self._postprocess_text(result)
         
         # Cache the result
-        if self.cache:
-            cache_key = self._get_cache_key(original_text)
-            self.cache.set(cache_key, final_result, original_text, self.source_lang, self.target_lang)
+        self._store_translation(processed_text, original_text, final_result, cache_key)
         
         return final_result
     
-    def _translate_single_text(self, processed_text: str, original_text: str, progress_callback=None) -> str:
+    def _store_translation(self, processed_text: str, original_text: str, translation: str,
+                           cache_key: Optional[str] = None):
+        """Store a finished translation in the translation cache."""
+        if self.cache:
+            cache_key = cache_key or self._get_cache_key(processed_text)
+            self.cache.set(cache_key, translation, original_text, self.source_lang, self.target_lang)
+    
+    def _translate_sentences(self, sentences: List[str]) -> Optional[List[str]]:
+        """
+        Translate several sentences with a single service request.
+        
+        Sentences are sent newline-separated and the result is split back on
+        newlines, so line breaks inside a sentence are flattened to spaces
+        first. Returns None if no service returned one line per sentence.
+        """
+        joined = '\n'.join(_LINE_BREAK_PATTERN.sub(' ', sentence) for sentence in sentences)
+        
+        for service_name in self._service_order:
+            try:
+                translated = self.services[service_name].translate(joined)
+            except TranslationError as e:
+                logger.warning(f"{service_name} failed for sentence batch: {e}")
+                continue
+            
+            lines = [line.strip() for line in (translated or '').split('\n') if line.strip()]
+            if len(lines) == len(sentences):
+                self.stats['service_usage'][service_name] += 1
+                return lines
+            
+            logger.debug(f"{service_name} returned {len(lines)} lines for {len(sentences)} sentences")
+        
+        return None
+    
+    def _translate_single_text(self, processed_text: str, original_text: str, progress_callback=None,
+                               cache_key: Optional[str] = None) -> str:
         """
         Translate a single piece of text using available services.
         """
         # Try translation with services
-        services_to_try = [self.primary_service] + self.fallback_services
         last_error = None
         
-        for service_name in services_to_try:
+        for service_name in self._service_order:
             service = self.services[service_name]
+            attempt = 1
             
-            for attempt in range(self.max_retries):
+            # Only rate limiting is retried; any other failure moves on to the next service
+            while True:
                 try:
-                    logger.debug(f"Translating with {service_name} (attempt {attempt + 1}): {original_text[:50]}...")
-                    
+                    logger.debug(f"Translating with {service_name} (attempt {attempt}): {original_text[:50]}...")
                     translated = service.translate(processed_text)
+                
+                except RateLimitError as e:
+                    last_error = e
+                    if attempt >= self.max_retries:
+                        logger.warning(f"{service_name} still rate limited after {attempt} attempts: {e}")
+                        break
                     
-                    if translated and translated.strip():
-                        # Post-process translation
-                        final_translation = self._postprocess_text(translated, original_text)
-                        
-                        # Cache the result
-                        if self.cache:
-                            cache_key = self._get_cache_key(original_text)
-                            self.cache.set(cache_key, final_translation, original_text, self.source_lang, self.target_lang)
-                        
-                        # Update stats
-                        self.stats['service_usage'][service_name] += 1
-                        
-                        logger.debug(f"Successfully translated: {original_text[:30]}... -> {final_translation[:30]}...")
-                        
-                        if progress_callback:
-                            progress_callback(1)
-                        
-                        return final_translation
+                    delay = min(2 ** (attempt - 1), 30)  # Exponential backoff
+                    logger.warning(f"{service_name} rate limited, retrying in {delay}s (attempt {attempt}): {e}")
+                    time.sleep(delay)
+                    attempt += 1
+                    continue
                 
                 except TranslationError as e:
                     last_error = e
-                    logger.warning(f"{service_name} failed (attempt {attempt + 1}): {e}")
-                    if attempt < self.max_retries - 1:
-                        time.sleep(2 ** attempt)  # Exponential backoff
-                    break  # Try next service
+                    logger.warning(f"{service_name} failed: {e}")
+                    break
                 
                 except Exception as e:
                     last_error = e
                     logger.error(f"Unexpected error with {service_name}: {e}")
-                    if attempt < self.max_retries - 1:
-                        time.sleep(2)
+                    break
+                
+                if translated and not translated.isspace():
+                    # Post-process translation
+                    final_translation = self._postprocess_text(translated)
+                    
+                    # Cache the result
+                    self._store_translation(processed_text, original_text, final_translation, cache_key)
+                    
+                    # Update stats
+                    self.stats['service_usage'][service_name] += 1
+                    
+                    logger.debug(f"Successfully translated: {original_text[:30]}... -> {final_translation[:30]}...")
+                    
+                    if progress_callback:
+                        progress_callback(1)
+                    
+                    return final_translation
+                
+                break  # Empty result, try next service
         
         # If all services failed, return original text
         self.stats['failed_translations'] += 1
@@ -368,16 +473,29 @@ class SubtitleTranslator:
         results = []
         total = len(texts)
         
-        for i, text in enumerate(texts):
-            translated = self.translate_text(text)
-            results.append(translated)
-            
-            if progress_callback:
-                progress_callback(i + 1, total)
-            
-            # Small delay between translations to avoid rate limiting
-            if i < total - 1:
-                time.sleep(0.1)
+        # Subtitles repeat a lot of lines (names, short replies), so each
+        # distinct string is translated once and reused for its duplicates
+        unique: Dict[str, str] = {}
+        
+        # Hash all distinct lines up front instead of once per translate_text call
+        cache_keys: Dict[str, str] = {}
+        if self.cache:
+            distinct = list(dict.fromkeys(texts))
+            cache_keys = dict(zip(distinct, self._get_cache_keys([t.strip() for t in distinct])))
+        
+        # Cache writes are committed once when the batch finishes
+        with self.cache.batch() if self.cache else nullcontext():
+            for i, text in enumerate(texts):
+                if text in unique:
+                    self.stats['duplicate_lines'] += 1
+                    results.append(unique[text])
+                else:
+                    translated = self.translate_text(text, cache_key=cache_keys.get(text))
+                    unique[text] = translated
+                    results.append(translated)
+                
+                if progress_callback:
+                    progress_callback(i + 1, total)
         
         return results
     
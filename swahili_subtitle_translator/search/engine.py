@@ -3,13 +3,20 @@ Main subtitle search engine that coordinates multiple sources.
 """
 
 import asyncio
+import heapq
 import logging
+import threading
+import time
+from itertools import chain
+from collections import OrderedDict
+from functools import partial
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Dict, Optional, Union
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, List, Dict, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
 import tempfile
 
-from .models import SearchQuery, SearchResult, SourceType
+from .models import SearchQuery, SearchResult, SourceType, SOURCE_PRIORITY
 from .sources import (
     SubtitleSource, 
     OpenSubtitlesSource, 
@@ -19,9 +26,21 @@ from .sources import (
     SubtitleSourceError
 )
 from ..utils.exceptions import SubtitleTranslatorError
+from ..utils.http import create_adapter
 
 logger = logging.getLogger(__name__)
 
+# Sort by source priority, then title
+_RESULT_SORT_KEY = attrgetter('_priority', '_title_lower')
+
+# Sources registered with every engine, in search order
+_SOURCE_CLASSES: Dict[SourceType, Callable[..., SubtitleSource]] = {
+    SourceType.OPENSUBTITLES: OpenSubtitlesSource,
+    SourceType.SUBSCENE: SubsceneSource,
+    SourceType.YIFY: YIFYSubtitlesSource,
+    SourceType.MOCK: MockSubtitleSource,  # Always add mock source for demonstration
+}
+
 
 class SubtitleSearchEngine:
     """Main search engine for coordinating subtitle sources."""
@@ -29,7 +48,9 @@ class SubtitleSearchEngine:
     def __init__(self, 
                  opensubtitles_api_key: Optional[str] = None,
                  max_workers: int = 3,
-                 timeout_per_source: int = 30):
+                 timeout_per_source: int = 30,
+                 cache_ttl: float = 60,
+                 cache_size: int = 256):
         """
         Initialize the search engine.
         
@@ -37,47 +58,110 @@ class SubtitleSearchEngine:
             opensubtitles_api_key: Optional API key for OpenSubtitles
             max_workers: Maximum number of concurrent source searches
             timeout_per_source: Timeout for each source search in seconds
+            cache_ttl: Seconds to reuse results for a repeated query (0 disables)
+            cache_size: Maximum number of queries kept in the result cache
         """
         self.max_workers = max_workers
         self.timeout_per_source = timeout_per_source
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        
+        # Recent results keyed by query, each stored with its expiry time
+        self._result_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # Worker threads are reused across searches
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="subsearch")
         
-        # Initialize sources
-        self.sources: Dict[SourceType, SubtitleSource] = {}
+        # Keep-alive connection pool shared by every source
+        self._http_adapter = create_adapter(pool_connections=max_workers, pool_maxsize=max_workers * 4)
+        
+        # Sources are constructed on first use
+        self._sources: Dict[SourceType, SubtitleSource] = {}
+        self._source_factories: Dict[SourceType, Callable[[], SubtitleSource]] = {}
+        self._sources_lock = threading.Lock()
         self._initialize_sources(opensubtitles_api_key)
         
-        logger.info(f"Initialized search engine with {len(self.sources)} sources")
+        logger.info(f"Initialized search engine with {len(self._source_factories)} sources")
     
-    def _initialize_sources(self, opensubtitles_api_key: Optional[str] = None):
-        """Initialize all available subtitle sources."""
-        try:
-            # Use API if key is provided, otherwise fallback to web scraping
-            use_api = bool(opensubtitles_api_key)
-            self.sources[SourceType.OPENSUBTITLES] = OpenSubtitlesSource(
-                api_key=opensubtitles_api_key, 
-                use_api=use_api
-            )
-            logger.info(f"OpenSubtitles source initialized (API: {use_api})")
-        except Exception as e:
-            logger.warning(f"Failed to initialize OpenSubtitles source: {e}")
-        
+    def close(self):
+        """Shut down the worker threads and pooled connections."""
+        self._executor.shutdown(wait=False)
+        self._http_adapter.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def __del__(self):
+        """Release worker threads when the engine is destroyed."""
         try:
-            self.sources[SourceType.SUBSCENE] = SubsceneSource()
-            logger.info("Subscene source initialized")
-        except Exception as e:
-            logger.warning(f"Failed to initialize Subscene source: {e}")
+            self.close()
+        except Exception:
+            pass
+    
+    def _initialize_sources(self, opensubtitles_api_key: Optional[str] = None):
+        """Register factories for all available subtitle sources."""
+        self._source_factories = {
+            source_type: partial(source_class, adapter=self._http_adapter)
+            for source_type, source_class in _SOURCE_CLASSES.items()
+        }
         
-        try:
-            self.sources[SourceType.YIFY] = YIFYSubtitlesSource()
-            logger.info("YIFY source initialized")
-        except Exception as e:
-            logger.warning(f"Failed to initialize YIFY source: {e}")
+        # Use API if key is provided, otherwise fallback to web scraping
+        self._source_factories[SourceType.OPENSUBTITLES] = partial(
+            self._source_factories[SourceType.OPENSUBTITLES],
+            api_key=opensubtitles_api_key,
+            use_api=bool(opensubtitles_api_key)
+        )
+    
+    def _get_source(self, source_type: SourceType) -> Optional[SubtitleSource]:
+        """Get a source, constructing it on first use."""
+        source = self._sources.get(source_type)
+        if source is not None:
+            return source
         
-        # Always add mock source for demonstration
-        try:
-            self.sources[SourceType.MOCK] = MockSubtitleSource()
-            logger.info("Mock source initialized")
-        except Exception as e:
-            logger.warning(f"Failed to initialize Mock source: {e}")
+        with self._sources_lock:
+            source = self._sources.get(source_type)
+            if source is not None:
+                return source
+            
+            factory = self._source_factories.get(source_type)
+            if factory is None:
+                return None
+            
+            try:
+                source = factory()
+            except Exception as e:
+                logger.warning(f"Failed to initialize {source_type.value} source: {e}")
+                del self._source_factories[source_type]
+                return None
+            
+            # Make the source's HTTP calls give up within the search timeout
+            source.request_timeout = min(source.request_timeout, self.timeout_per_source)
+            self._sources[source_type] = source
+            logger.info(f"{source.name} source initialized")
+            return source
+    
+    @property
+    def sources(self) -> Dict[SourceType, SubtitleSource]:
+        """All available sources (constructs any not yet used)."""
+        constructed = {}
+        for source_type in list(self._source_factories):
+            source = self._get_source(source_type)
+            if source is not None:
+                constructed[source_type] = source
+        return constructed
+    
+    @sources.setter
+    def sources(self, sources: Dict[SourceType, SubtitleSource]):
+        with self._sources_lock:
+            self._sources = dict(sources)
+            self._source_factories = {
+                source_type: (lambda source=source: source)
+                for source_type, source in sources.items()
+            }
     
     def search(self, 
                query: Union[SearchQuery, str], 
@@ -94,76 +178,241 @@ class SubtitleSearchEngine:
         Returns:
             Combined list of search results from all sources
         """
+        query, available_sources = self._prepare_search(query, sources)
+        
+        if not available_sources:
+            return []
+        
+        cache_key = self._cache_key(query, available_sources)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+        
+        if parallel and len(available_sources) > 1:
+            results, complete = self._search_parallel(query, available_sources)
+        else:
+            results, complete = self._search_sequential(query, available_sources)
+        
+        # Partial results would hide failed or slower sources from repeat queries
+        if complete:
+            self._set_cached(cache_key, results)
+        return results
+    
+    async def asearch(self, 
+                      query: Union[SearchQuery, str], 
+                      sources: Optional[List[SourceType]] = None) -> List[SearchResult]:
+        """
+        Search for subtitles from asynchronous code.
+        
+        All sources are queried concurrently without blocking the event loop,
+        and each source is given up to ``timeout_per_source`` seconds.
+        
+        Args:
+            query: Search query (can be SearchQuery object or title string)
+            sources: List of sources to search (None for all available)
+            
+        Returns:
+            Combined list of search results from all sources
+        """
+        query, available_sources = self._prepare_search(query, sources)
+        
+        if not available_sources:
+            return []
+        
+        cache_key = self._cache_key(query, available_sources)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+        
+        tasks = [
+            asyncio.wait_for(
+                source.search_async(query, executor=self._executor),
+                self.timeout_per_source
+            )
+            for source in available_sources.values()
+        ]
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        per_source = []
+        complete = True
+        for source_type, outcome in zip(available_sources, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"Search failed for {source_type.value}: {outcome!r}")
+                complete = False
+                continue
+            per_source.append(outcome)
+            logger.info(f"{source_type.value} returned {len(outcome)} results")
+        
+        all_results = list(chain.from_iterable(per_source))
+        results = self._deduplicate_and_sort(all_results, query.limit)
+        
+        # As in search(), results missing a source are not cached
+        if complete:
+            self._set_cached(cache_key, results)
+        return results
+    
+    def _prepare_search(self, 
+                        query: Union[SearchQuery, str], 
+                        sources: Optional[List[SourceType]]):
+        """Normalize the query and select the sources to search."""
         # Convert string to SearchQuery if needed
         if isinstance(query, str):
             query = SearchQuery(title=query)
         
         # Use all sources if none specified
         if sources is None:
-            sources = list(self.sources.keys())
+            sources = list(self._source_factories)
         
-        # Filter available sources
-        available_sources = {
-            source_type: source for source_type, source in self.sources.items()
-            if source_type in sources
-        }
+        # Only construct the sources being searched
+        available_sources = {}
+        for source_type in list(self._source_factories):
+            if source_type in sources:
+                source = self._get_source(source_type)
+                if source is not None:
+                    available_sources[source_type] = source
         
         if not available_sources:
             logger.warning("No available sources for search")
-            return []
+        else:
+            logger.info(f"Searching {len(available_sources)} sources for: {query.title}")
         
-        logger.info(f"Searching {len(available_sources)} sources for: {query.title}")
+        return query, available_sources
+    
+    @staticmethod
+    def _cache_key(query: SearchQuery, sources: Dict[SourceType, SubtitleSource]) -> tuple:
+        """Build a hashable key identifying a query against a set of sources."""
+        return (
+            query.title.strip().lower(), query.year, query.season, query.episode,
+            query.language, query.hearing_impaired, query.release_info, query.limit,
+            frozenset(sources)
+        )
+    
+    def _get_cached(self, key: tuple) -> Optional[List[SearchResult]]:
+        """Return cached results for a query if they have not expired."""
+        if self.cache_ttl <= 0:
+            return None
         
-        if parallel and len(available_sources) > 1:
-            return self._search_parallel(query, available_sources)
-        else:
-            return self._search_sequential(query, available_sources)
+        with self._cache_lock:
+            entry = self._result_cache.get(key)
+            if entry is None:
+                return None
+            expires_at, results = entry
+            if expires_at < time.monotonic():
+                del self._result_cache[key]
+                return None
+            self._result_cache.move_to_end(key)
+        
+        logger.info(f"Returning {len(results)} cached results")
+        return list(results)
+    
+    def _set_cached(self, key: tuple, results: List[SearchResult]):
+        """Remember results for a query; empty results are not cached."""
+        if self.cache_ttl <= 0 or not results:
+            return
+        
+        with self._cache_lock:
+            self._result_cache[key] = (time.monotonic() + self.cache_ttl, list(results))
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > self.cache_size:
+                self._result_cache.popitem(last=False)
+    
+    def clear_cache(self):
+        """Forget all cached search results."""
+        with self._cache_lock:
+            self._result_cache.clear()
     
     def _search_parallel(self, 
                         query: SearchQuery, 
-                        sources: Dict[SourceType, SubtitleSource]) -> List[SearchResult]:
-        """Search sources in parallel using ThreadPoolExecutor."""
-        all_results = []
-        
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit search tasks
-            future_to_source = {
-                executor.submit(self._search_single_source, source, query): source_type
-                for source_type, source in sources.items()
-            }
-            
-            # Collect results as they complete
+                        sources: Dict[SourceType, SubtitleSource]) -> Tuple[List[SearchResult], bool]:
+        """
+        Search sources in parallel on the shared thread pool.
+        
+        Stops waiting for slower sources once ``query.limit`` unique results
+        have arrived and no unfinished source could rank above them: results
+        sort by source priority first, so only sources with a lower priority
+        than the current last-placed result are cancelled.
+        
+        Returns:
+            The results, and whether every source finished successfully
+        """
+        complete = True
+        # Source priority of every unique result seen so far
+        priority_by_key: Dict[int, int] = {}
+        
+        # Each source writes into its own slot, so results keep source order
+        per_source: List[List[SearchResult]] = [[] for _ in sources]
+        
+        # Submit search tasks
+        future_to_source = {
+            self._executor.submit(source.cached_search, query): (index, source_type)
+            for index, (source_type, source) in enumerate(sources.items())
+        }
+        
+        # Collect results as they complete; all sources share one deadline
+        try:
             for future in as_completed(future_to_source, timeout=self.timeout_per_source):
-                source_type = future_to_source[future]
+                index, source_type = future_to_source[future]
                 try:
-                    results = future.result(timeout=5)  # Short timeout for result retrieval
-                    all_results.extend(results)
+                    results = future.result()
+                    per_source[index] = results
                     logger.info(f"{source_type.value} returned {len(results)} results")
                 except Exception as e:
                     logger.error(f"Search failed for {source_type.value}: {e}")
+                    complete = False
+                    continue
+                
+                for r in results:
+                    priority_by_key.setdefault(r._dedup_key, r._priority)
+                if len(priority_by_key) < query.limit:
+                    continue
+                
+                # Equal priorities tie-break on title, so they could still place
+                cutoff = heapq.nsmallest(query.limit, priority_by_key.values())[-1]
+                pending = [(f, t) for f, (_, t) in future_to_source.items() if not f.done()]
+                if all(SOURCE_PRIORITY.get(t, 999) > cutoff for _, t in pending):
+                    complete = not pending
+                    for pending_future, pending_type in pending:
+                        pending_future.cancel()
+                        logger.info(f"Skipping {pending_type.value}: result limit reached")
+                    break
+        except FuturesTimeoutError:
+            complete = False
+            for future, (_, source_type) in future_to_source.items():
+                if not future.done():
+                    future.cancel()
+                    logger.warning(f"{source_type.value} timed out after {self.timeout_per_source}s")
         
-        return self._deduplicate_and_sort(all_results)
+        all_results = list(chain.from_iterable(per_source))
+        return self._deduplicate_and_sort(all_results, query.limit), complete
     
     def _search_sequential(self, 
                           query: SearchQuery, 
-                          sources: Dict[SourceType, SubtitleSource]) -> List[SearchResult]:
-        """Search sources sequentially."""
-        all_results = []
+                          sources: Dict[SourceType, SubtitleSource]) -> Tuple[List[SearchResult], bool]:
+        """
+        Search sources sequentially.
+        
+        Returns:
+            The results, and whether every source succeeded
+        """
+        complete = True
+        per_source = []
         
         for source_type, source in sources.items():
             try:
-                results = self._search_single_source(source, query)
-                all_results.extend(results)
+                results = source.cached_search(query)
+                per_source.append(results)
                 logger.info(f"{source_type.value} returned {len(results)} results")
             except Exception as e:
                 logger.error(f"Search failed for {source_type.value}: {e}")
+                complete = False
         
-        return self._deduplicate_and_sort(all_results)
+        all_results = list(chain.from_iterable(per_source))
+        return self._deduplicate_and_sort(all_results, query.limit), complete
     
     def _search_single_source(self, source: SubtitleSource, query: SearchQuery) -> List[SearchResult]:
         """Search a single source with error handling."""
         try:
-            return source.search(query)
+            return source.cached_search(query)
         except SubtitleSourceError as e:
             logger.error(f"Source {source.name} search failed: {e}")
             return []
@@ -171,27 +420,21 @@ class SubtitleSearchEngine:
             logger.error(f"Unexpected error searching {source.name}: {e}")
             return []
     
-    def _deduplicate_and_sort(self, results: List[SearchResult]) -> List[SearchResult]:
+    def _deduplicate_and_sort(self, 
+                              results: List[SearchResult], 
+                              limit: Optional[int] = None) -> List[SearchResult]:
         """Remove duplicates and sort results by relevance."""
-        # Simple deduplication by title and source
-        seen = set()
-        unique_results = []
+        # Deduplicate by the release fingerprint cached on each result
+        best: Dict[int, SearchResult] = {}
         
         for result in results:
-            key = (result.title.lower(), result.source)
-            if key not in seen:
-                seen.add(key)
-                unique_results.append(result)
+            best.setdefault(result._dedup_key, result)
         
         # Sort by source priority and title
-        source_priority = {
-            SourceType.OPENSUBTITLES: 1,
-            SourceType.SUBSCENE: 2,
-            SourceType.YIFY: 3,
-            SourceType.MOCK: 4  # Mock source has lowest priority
-        }
-        
-        unique_results.sort(key=lambda r: (source_priority.get(r.source, 999), r.title.lower()))
+        if limit is not None and limit < len(best):
+            unique_results = heapq.nsmallest(limit, best.values(), key=_RESULT_SORT_KEY)
+        else:
+            unique_results = sorted(best.values(), key=_RESULT_SORT_KEY)
         
         logger.info(f"Returning {len(unique_results)} unique results after deduplication")
         return unique_results
@@ -210,14 +453,16 @@ class SubtitleSearchEngine:
             Path to the downloaded subtitle file
         """
         # Get the appropriate source
-        source = self.sources.get(result.source)
+        source = self._get_source(result.source)
         if not source:
             raise SubtitleTranslatorError(f"Source {result.source} not available")
         
         # Generate output path if not provided
         if output_path is None:
             suffix = f".{result.format.value}" if result.format else ".srt"
-            output_path = Path(tempfile.mktemp(suffix=suffix))
+            # Create the file atomically instead of just picking an unused name
+            with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+                output_path = Path(tmp.name)
         
         # Ensure parent directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -238,7 +483,7 @@ class SubtitleSearchEngine:
     
     def get_available_sources(self) -> List[SourceType]:
         """Get list of available subtitle sources."""
-        return list(self.sources.keys())
+        return list(self._source_factories)
     
     def get_source_info(self) -> Dict[SourceType, Dict[str, str]]:
         """Get information about available sources."""
@@ -262,18 +507,31 @@ class SubtitleSearchEngine:
             Dictionary mapping source types to success status
         """
         logger.info(f"Testing sources with query: {test_query}")
-        test_results = {}
+        sources = self.sources
+        test_results = dict.fromkeys(sources, False)
         
         query = SearchQuery(title=test_query, limit=3)
         
-        for source_type, source in self.sources.items():
-            try:
-                results = self._search_single_source(source, query)
-                test_results[source_type] = len(results) > 0
-                logger.info(f"{source.name}: {'✓' if test_results[source_type] else '✗'}")
-            except Exception as e:
-                test_results[source_type] = False
-                logger.error(f"{source.name}: ✗ ({e})")
+        # Probe every source at once on the shared thread pool
+        future_to_source = {
+            self._executor.submit(self._search_single_source, source, query): source_type
+            for source_type, source in sources.items()
+        }
+        
+        try:
+            for future in as_completed(future_to_source, timeout=self.timeout_per_source):
+                source_type = future_to_source[future]
+                source = sources[source_type]
+                try:
+                    test_results[source_type] = len(future.result()) > 0
+                    logger.info(f"{source.name}: {'✓' if test_results[source_type] else '✗'}")
+                except Exception as e:
+                    logger.error(f"{source.name}: ✗ ({e})")
+        except FuturesTimeoutError:
+            for future, source_type in future_to_source.items():
+                if not future.done():
+                    future.cancel()
+                    logger.error(f"{sources[source_type].name}: ✗ (timed out)")
         
         return test_results
 
@@ -290,13 +548,13 @@ def search_subtitles(title: str,
     Args:
         title: Movie or TV show title to search for
         language: Subtitle language code (default: "en")
-        limit: Maximum number of results per source
+        limit: Maximum number of results to return
         sources: List of sources to search (None for all)
         opensubtitles_api_key: Optional OpenSubtitles API key
         
     Returns:
         List of search results
     """
-    engine = SubtitleSearchEngine(opensubtitles_api_key=opensubtitles_api_key)
     query = SearchQuery(title=title, language=language, limit=limit)
-    return engine.search(query, sources=sources)
+    with SubtitleSearchEngine(opensubtitles_api_key=opensubtitles_api_key) as engine:
+        return engine.search(query, sources=sources)
@@ -2,11 +2,16 @@
 Data models for subtitle search and metadata.
 """
 
-from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
+import sys
+from functools import lru_cache
+from dataclasses import dataclass, field, fields
+from typing import Optional, Dict, Any, Tuple
 from enum import Enum
 from datetime import datetime
 
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 
 class SubtitleFormat(Enum):
     """Supported subtitle formats."""
@@ -26,7 +31,28 @@ class SourceType(Enum):
     LOCAL = "local"
 
 
-@dataclass
+# Result ordering by source (lower sorts first)
+SOURCE_PRIORITY = {
+    SourceType.OPENSUBTITLES: 1,
+    SourceType.SUBSCENE: 2,
+    SourceType.YIFY: 3,
+    SourceType.MOCK: 4  # Mock source has lowest priority
+}
+
+
+@lru_cache(maxsize=None)
+def _to_format(value: str) -> SubtitleFormat:
+    """Convert a raw format string to SubtitleFormat (memoized)."""
+    return SubtitleFormat(value.lower())
+
+
+@lru_cache(maxsize=None)
+def _to_source(value: str) -> SourceType:
+    """Convert a raw source string to SourceType (memoized)."""
+    return SourceType(value.lower())
+
+
+@dataclass(**_SLOTS)
 class SubtitleMetadata:
     """Metadata for a subtitle file."""
     
@@ -43,10 +69,10 @@ class SubtitleMetadata:
     def __post_init__(self):
         """Validate and normalize data after initialization."""
         if isinstance(self.format, str):
-            self.format = SubtitleFormat(self.format.lower())
+            self.format = _to_format(self.format)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SearchResult:
     """Result from subtitle search."""
     
@@ -71,14 +97,27 @@ class SearchResult:
     episode: Optional[int] = None
     metadata: Dict[str, Any] = None
     
+    # Sort and dedup keys computed once at creation
+    _priority: int = field(init=False, repr=False, compare=False, default=999)
+    _title_lower: str = field(init=False, repr=False, compare=False, default="")
+    _dedup_key: int = field(init=False, repr=False, compare=False, default=0)
+    _display_name: Optional[str] = field(init=False, repr=False, compare=False, default=None)
+    
     def __post_init__(self):
         """Validate and normalize data after initialization."""
         if isinstance(self.format, str):
-            self.format = SubtitleFormat(self.format.lower())
+            self.format = _to_format(self.format)
         if isinstance(self.source, str):
-            self.source = SourceType(self.source.lower())
+            self.source = _to_source(self.source)
         if self.metadata is None:
             self.metadata = {}
+        self._priority = SOURCE_PRIORITY.get(self.source, 999)
+        self._title_lower = self.title.lower()
+        # Distinct releases of the same title from one source are kept apart
+        self._dedup_key = hash((
+            self._title_lower, self.year, self.season, self.episode,
+            self.release_info, self.source
+        ))
     
     @property
     def is_tv_show(self) -> bool:
@@ -87,46 +126,38 @@ class SearchResult:
     
     @property
     def display_name(self) -> str:
-        """Get display-friendly name."""
-        name = self.title
-        if self.year:
-            name += f" ({self.year})"
-        if self.season is not None:
-            name += f" S{self.season:02d}"
-        if self.episode is not None:
-            name += f"E{self.episode:02d}"
-        if self.release_info:
-            name += f" [{self.release_info}]"
-        return name
+        """Get display-friendly name (built on first access)."""
+        # cached_property needs an instance __dict__, which slotted results lack
+        if self._display_name is None:
+            parts = [self.title]
+            if self.year:
+                parts.append(f" ({self.year})")
+            if self.season is not None:
+                parts.append(f" S{self.season:02d}")
+            if self.episode is not None:
+                parts.append(f"E{self.episode:02d}")
+            if self.release_info:
+                parts.append(f" [{self.release_info}]")
+            self._display_name = "".join(parts)
+        return self._display_name
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return {
-            "id": self.id,
-            "title": self.title,
-            "year": self.year,
-            "language": self.language,
-            "format": self.format.value,
-            "source": self.source.value,
-            "download_url": self.download_url,
-            "release_info": self.release_info,
-            "uploader": self.uploader,
-            "download_count": self.download_count,
-            "rating": self.rating,
-            "hearing_impaired": self.hearing_impaired,
-            "fps": self.fps,
-            "file_size": self.file_size,
-            "upload_date": self.upload_date.isoformat() if self.upload_date else None,
-            "season": self.season,
-            "episode": self.episode,
-            "display_name": self.display_name,
-            "metadata": self.metadata
-        }
+        data = {name: getattr(self, name) for name in _RESULT_FIELDS}
+        data["format"] = self.format.value
+        data["source"] = self.source.value
+        data["upload_date"] = self.upload_date.isoformat() if self.upload_date else None
+        data["display_name"] = self.display_name
+        return data
+
+
+# Public SearchResult fields, in declaration order (excludes cached sort keys)
+_RESULT_FIELDS = tuple(f.name for f in fields(SearchResult) if f.init)
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class SearchQuery:
-    """Search query parameters."""
+    """Search query parameters (immutable and hashable)."""
     
     title: str
     year: Optional[int] = None
@@ -138,24 +169,27 @@ class SearchQuery:
     
     # Search options
     limit: int = 10
-    sources: Optional[List[SourceType]] = None
+    sources: Optional[Tuple[SourceType, ...]] = None
     
     def __post_init__(self):
         """Validate and normalize search parameters."""
+        # Fields are frozen, so normalized values are set through object.__setattr__
         if self.sources is None:
-            self.sources = list(SourceType)
-        elif isinstance(self.sources, list) and self.sources:
+            object.__setattr__(self, 'sources', tuple(SourceType))
+        elif isinstance(self.sources, (list, tuple)) and self.sources:
             # Convert string sources to enum
             normalized_sources = []
             for source in self.sources:
                 if isinstance(source, str):
                     try:
-                        normalized_sources.append(SourceType(source.lower()))
+                        normalized_sources.append(_to_source(source))
                     except ValueError:
                         continue  # Skip invalid sources
                 elif isinstance(source, SourceType):
                     normalized_sources.append(source)
-            self.sources = normalized_sources
+            object.__setattr__(self, 'sources', tuple(normalized_sources))
+        else:
+            object.__setattr__(self, 'sources', tuple(self.sources))
     
     @property
     def is_tv_show(self) -> bool:
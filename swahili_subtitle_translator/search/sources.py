@@ -2,22 +2,61 @@
 Subtitle source implementations for various websites and APIs.
 """
 
+import os
 import re
+import html
+import json
 import time
+import random
+import hashlib
+from functools import lru_cache
+from itertools import islice
+from collections import OrderedDict
+import asyncio
 import logging
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
-from urllib.parse import urljoin, quote
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, as_completed
+from typing import List, Optional, Dict, Any, BinaryIO
+from urllib.parse import urljoin, quote, urlparse
+from email.utils import parsedate_to_datetime
 from pathlib import Path
+import shutil
 import tempfile
 import zipfile
-import io
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from bs4 import BeautifulSoup, SoupStrainer
+
+# Prefer the C-backed lxml parser; fall back to the pure-Python one
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+_HTML_PARSER = 'lxml' if LXML_AVAILABLE else 'html.parser'
+
+# Try to import orjson for faster API response decoding
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Try to import selectolax for faster result-page parsing
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
 
 from .models import SearchResult, SearchQuery, SourceType, SubtitleFormat
 from ..utils.exceptions import SubtitleTranslatorError
+from ..utils.http import mount_adapter, get_shared_adapter
+from ..utils.rate_limit import TokenBucket, CircuitBreaker
 
 logger = logging.getLogger(__name__)
 
@@ -27,28 +66,157 @@ class SubtitleSourceError(SubtitleTranslatorError):
     pass
 
 
+def _loads(data: bytes) -> Any:
+    """Decode a JSON response body."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Link and row patterns used when scraping result pages
+_RE_TVSHOW = re.compile(r'/tvshow-\d+\.html')
+_RE_OS_ROW = re.compile(r'name\d+')
+_RE_OS_SUBTITLES = re.compile(r'/en/subtitles/')
+_RE_OS_SERVE = re.compile(r'/en/subtitleserve/')
+_RE_SUBSCENE = re.compile(r'/subtitles/')
+_RE_YIFY_MOVIE = re.compile(r'/movie-imdb/')
+_RE_YIFY_SUB = re.compile(r'/subtitle/')
+_RE_YIFY_SUB_HREF = re.compile(rb'<a\s[^>]*?href="([^"]*/subtitle/[^"]*)"')
+
+# Only build the parts of each page the scrapers look at
+_TVSHOW_LINKS = SoupStrainer('a', href=_RE_TVSHOW)
+_OS_ROWS = SoupStrainer('tr', id=_RE_OS_ROW)
+_SUBSCENE_LINKS = SoupStrainer('a', href=_RE_SUBSCENE)
+_YIFY_MOVIE_LINKS = SoupStrainer('a', href=_RE_YIFY_MOVIE)
+_YIFY_SUB_LINKS = SoupStrainer('a', href=_RE_YIFY_SUB)
+
+# Title helpers used by the mock source
+_RE_YEAR = re.compile(r'(19|20)\d{2}')
+_RE_TV_INDICATOR = re.compile(r's0?1|season|episode|series|tv|show', re.IGNORECASE)
+_RE_STANDALONE_YEAR = re.compile(r'\b(19|20)\d{2}\b')
+_RE_SHOW_SUFFIX = re.compile(r'\s*-\s*(season|series|tv|show).*$', re.IGNORECASE)
+_RE_SLUG_INVALID = re.compile(r'[^a-z0-9\s-]')
+_RE_SLUG_SEPARATORS = re.compile(r'[\s-]+')
+
+# Per-source search result cache bounds
+_SEARCH_CACHE_SIZE = 256
+_SEARCH_CACHE_TTL = 600.0
+
+# Subtitle file extensions looked for inside archives
+_RE_SUB_EXT = re.compile(r'\.(?:srt|ass|ssa|vtt|sub)\Z', re.IGNORECASE)
+
+# Statuses that mean "slow down and try again"
+_RETRY_STATUSES = (403, 429, 503)
+_BASE_BACKOFF = 1.0
+_MAX_BACKOFF = 60.0
+
+# Backoff jitter has its own generator; the mock source reseeds the global one
+_jitter = random.Random()
+
+# Hosts are skipped for a while after this many consecutive failed requests
+_HOST_FAILURE_THRESHOLD = 5
+_HOST_COOLDOWN = 120.0
+
+
+def _retry_after_seconds(response: requests.Response) -> Optional[float]:
+    """Parse a Retry-After header given as seconds or an HTTP date."""
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _declared_encoding(response: requests.Response) -> Optional[str]:
+    """
+    Charset from the Content-Type header, if the server declared one.
+    
+    Passing it to BeautifulSoup skips its encoding detection pass. Without
+    a declared charset requests falls back to ISO-8859-1, so in that case
+    None is returned and the parser sniffs the encoding itself.
+    """
+    if 'charset=' in response.headers.get('content-type', '').lower():
+        return response.encoding
+    return None
+
+
+def _backoff_delay(previous: float, response: Optional[requests.Response] = None) -> float:
+    """
+    Delay before the next retry: Retry-After if given, else decorrelated jitter.
+    
+    Each jittered delay is drawn between the base delay and three times the
+    previous one, so concurrent workers drift apart instead of retrying in
+    lockstep.
+    """
+    retry_after = _retry_after_seconds(response) if response is not None else None
+    if retry_after is None:
+        retry_after = _jitter.uniform(_BASE_BACKOFF, previous * 3)
+    return min(retry_after, _MAX_BACKOFF)
+
+
+# Shared by all sources, so a failing host is skipped whichever source hits it
+_host_breaker = CircuitBreaker(_HOST_FAILURE_THRESHOLD, _HOST_COOLDOWN)
+
+# One token bucket per host, so sources scraping the same site share its quota
+_host_buckets: Dict[str, TokenBucket] = {}
+_host_buckets_lock = threading.Lock()
+
+
+def _host_bucket(host: str, rate: float) -> TokenBucket:
+    """
+    Get the shared token bucket for a host, creating it on first use.
+    
+    When sources disagree on a host's rate, the slowest one wins.
+    """
+    with _host_buckets_lock:
+        bucket = _host_buckets.get(host)
+        if bucket is None:
+            # Allow short bursts while keeping the average request rate
+            bucket = _host_buckets[host] = TokenBucket(rate=rate, capacity=3)
+        else:
+            bucket.limit_rate(rate)
+        return bucket
+
+
 class SubtitleSource(ABC):
     """Abstract base class for subtitle sources."""
     
-    def __init__(self, base_url: str, name: str, rate_limit: float = 1.0):
+    # Whether the home page must be visited first to pick up cookies
+    requires_session_warmup: bool = True
+    
+    # Whether requests really go to base_url, counting against its host's quota
+    shares_host_quota: bool = True
+    
+    def __init__(self, base_url: str, name: str, rate_limit: float = 1.0,
+                 adapter: Optional[HTTPAdapter] = None):
         """
         Initialize subtitle source.
         
         Args:
             base_url: Base URL for the subtitle source
             name: Display name for the source
-            rate_limit: Minimum delay between requests (seconds)
+            rate_limit: Average delay between requests (seconds)
+            adapter: Connection pool to use (defaults to the process-wide pool)
         """
         self.base_url = base_url.rstrip('/')
         self.name = name
         self.rate_limit = rate_limit
+        self.request_timeout = 30  # Connect/read timeout for HTTP requests (seconds)
         self.session = requests.Session()
+        # Headers and cookies stay per source; keep-alive connections are shared
+        mount_adapter(self.session, adapter or get_shared_adapter())
         # Use more realistic browser headers to avoid 403 errors
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
             'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
+            'Accept-Encoding': ACCEPT_ENCODING,  # Only codings urllib3 can decode
             'DNT': '1',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
@@ -56,64 +224,89 @@ class SubtitleSource(ABC):
             'Sec-Fetch-Mode': 'navigate',
             'Sec-Fetch-Site': 'none',
             'Sec-Fetch-User': '?1',
-            'Cache-Control': 'max-age=0'
+            'Cache-Control': 'max-age=0',
+            'Referer': self.base_url
         })
-        self._last_request_time = 0
+        # Shared with any other source on the same host, at the strictest rate
+        if self.shares_host_quota:
+            self.bucket = _host_bucket(urlparse(self.base_url).netloc, 1 / rate_limit)
+        else:
+            self.bucket = TokenBucket(rate=1 / rate_limit, capacity=3)
         self._session_initialized = False
+        
+        # Recent results by normalized query, each stored with its expiry time
+        self.search_cache_ttl = _SEARCH_CACHE_TTL
+        self._search_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._search_cache_lock = threading.Lock()
+        self._search_inflight: Dict[tuple, Future] = {}
     
     def _initialize_session(self):
-        """Initialize session by visiting the home page to get cookies."""
+        """Initialize session by requesting the home page to get cookies."""
         if self._session_initialized:
             return
+        
+        if not self.requires_session_warmup:
+            self._session_initialized = True
+            return
             
         try:
             logger.debug(f"Initializing session for {self.name}")
-            response = self.session.get(self.base_url, timeout=10)
+            # Cookies arrive in the headers, so skip downloading the home page body
+            timeout = min(10, self.request_timeout)
+            response = self.session.head(self.base_url, allow_redirects=True, timeout=timeout)
+            if response.status_code in (405, 501):
+                # Site doesn't support HEAD
+                response = self.session.get(self.base_url, timeout=timeout)
             if response.status_code == 200:
                 self._session_initialized = True
                 logger.debug(f"Session initialized for {self.name}")
         except Exception as e:
             logger.warning(f"Failed to initialize session for {self.name}: {e}")
     
-    def _rate_limit_wait(self):
-        """Enforce rate limiting between requests."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.rate_limit:
-            time.sleep(self.rate_limit - elapsed)
-        self._last_request_time = time.time()
-    
     def _make_request(self, url: str, max_retries: int = 3, **kwargs) -> requests.Response:
         """Make a rate-limited HTTP request with retry logic."""
+        host = urlparse(url).netloc
+        if _host_breaker.is_open(host):
+            raise SubtitleSourceError(f"{host} is temporarily disabled after repeated failures")
+        
         self._initialize_session()
+        wait_time = _BASE_BACKOFF
         
         for attempt in range(max_retries):
-            self._rate_limit_wait()
+            self.bucket.acquire()
             
             try:
-                # Add some randomization to avoid being detected as a bot
-                headers = kwargs.pop('headers', {})
-                headers.update({
-                    'Referer': self.base_url,
-                })
-                
-                response = self.session.get(url, timeout=30, headers=headers, **kwargs)
+                # Referer and the browser headers come from the session defaults;
+                # any per-call headers in kwargs are merged in by requests
+                response = self.session.get(url, timeout=self.request_timeout, **kwargs)
                 
-                if response.status_code == 403:
+                if response.status_code in _RETRY_STATUSES:
+                    # Back off the request rate while the site is pushing back
+                    self.bucket.on_failure()
+                    _host_breaker.record_failure(host)
                     if attempt < max_retries - 1:
-                        wait_time = (2 ** attempt) + (time.time() % 3)  # Exponential backoff with jitter
-                        logger.warning(f"Got 403, retrying in {wait_time:.1f}s (attempt {attempt + 1}/{max_retries})")
+                        wait_time = _backoff_delay(wait_time, response)
+                        logger.warning(f"Got {response.status_code}, retrying in {wait_time:.1f}s (attempt {attempt + 1}/{max_retries})")
                         time.sleep(wait_time)
                         continue
                     else:
-                        logger.error(f"Still getting 403 after {max_retries} attempts, giving up")
-                        raise SubtitleSourceError(f"Access denied (403) after {max_retries} retries")
+                        logger.error(f"Still getting {response.status_code} after {max_retries} attempts, giving up")
+                        raise SubtitleSourceError(f"Access denied ({response.status_code}) after {max_retries} retries")
+                
+                if 400 <= response.status_code < 500:
+                    # Other client errors (404, 410, ...) won't change on retry
+                    logger.error(f"Got {response.status_code} for {url}, not retrying")
+                    raise SubtitleSourceError(f"HTTP {response.status_code} for {url}")
                 
                 response.raise_for_status()
+                self.bucket.on_success()
+                _host_breaker.record_success(host)
                 return response
                 
             except requests.RequestException as e:
+                _host_breaker.record_failure(host)
                 if attempt < max_retries - 1:
-                    wait_time = (2 ** attempt) + (time.time() % 2)
+                    wait_time = _backoff_delay(wait_time)
                     logger.warning(f"Request failed, retrying in {wait_time:.1f}s: {e}")
                     time.sleep(wait_time)
                     continue
@@ -121,6 +314,40 @@ class SubtitleSource(ABC):
                     logger.error(f"Request to {url} failed after {max_retries} attempts: {e}")
                     raise SubtitleSourceError(f"Request failed: {e}")
     
+    @staticmethod
+    def _write_response(response: requests.Response, output_path: Path) -> Path:
+        """Stream a response body to disk in chunks."""
+        with open(output_path, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                f.write(chunk)
+        return output_path
+    
+    @staticmethod
+    def _write_bytes(output_path: Path, data: bytes) -> Path:
+        """Write already-encoded content straight to a file descriptor."""
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+        fd = os.open(output_path, flags, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        return output_path
+    
+    @staticmethod
+    def _spool_response(response: requests.Response) -> BinaryIO:
+        """
+        Copy a streamed response body into a seekable temporary file.
+        
+        Bodies up to 4 MB stay in memory; larger ones spill to disk.
+        """
+        spool = tempfile.SpooledTemporaryFile(max_size=4 * 1024 * 1024)
+        response.raw.decode_content = True  # Undo any gzip/deflate transfer encoding
+        shutil.copyfileobj(response.raw, spool, 64 * 1024)
+        spool.seek(0)
+        return spool
+    
     @abstractmethod
     def search(self, query: SearchQuery) -> List[SearchResult]:
         """
@@ -147,16 +374,166 @@ class SubtitleSource(ABC):
             Path to the downloaded file
         """
         pass
+    
+    @staticmethod
+    def _extract_from_zip(archive: BinaryIO, output_path: Path) -> Path:
+        """Extract the first subtitle file from a ZIP archive."""
+        with zipfile.ZipFile(archive) as zf:
+            # Find the first subtitle file without listing the rest
+            subtitle_file = next(
+                (info for info in zf.infolist() if _RE_SUB_EXT.search(info.filename)),
+                None
+            )
+            
+            if subtitle_file is None:
+                raise SubtitleSourceError("No subtitle files found in archive")
+            
+            # Adjust output path extension if needed
+            original_ext = Path(subtitle_file.filename).suffix
+            if output_path.suffix != original_ext:
+                output_path = output_path.with_suffix(original_ext)
+            
+            # Size the buffer to the member (capped at 1 MiB) so most files copy in one read
+            buffer_size = min(max(subtitle_file.file_size, 1), 1 << 20)
+            with zf.open(subtitle_file) as src, open(output_path, 'wb') as dst:
+                shutil.copyfileobj(src, dst, buffer_size)
+        return output_path
+    
+    def cached_search(self, query: SearchQuery) -> List[SearchResult]:
+        """
+        Search, reusing this source's results for a recently seen query.
+        
+        Non-empty results are kept for ``search_cache_ttl`` seconds (set it
+        to 0 to disable caching). Concurrent calls for a query that is
+        already being searched wait for that search instead of repeating it.
+        
+        Args:
+            query: Search parameters
+            
+        Returns:
+            List of search results
+        """
+        if self.search_cache_ttl <= 0:
+            return self.search(query)
+        
+        key = (query.title.strip().lower(), query.language, query.year,
+               query.season, query.episode, query.limit)
+        
+        with self._search_cache_lock:
+            entry = self._search_cache.get(key)
+            if entry is not None:
+                expires_at, results = entry
+                if expires_at >= time.monotonic():
+                    self._search_cache.move_to_end(key)
+                    logger.debug(f"Using cached {self.name} results for: {query.title}")
+                    return list(results)
+                del self._search_cache[key]
+            
+            pending = self._search_inflight.get(key)
+            is_owner = pending is None
+            if is_owner:
+                pending = self._search_inflight[key] = Future()
+        
+        if not is_owner:
+            logger.debug(f"Waiting for in-flight {self.name} search for: {query.title}")
+            return list(pending.result())
+        
+        try:
+            results = self.search(query)
+        except BaseException as e:
+            with self._search_cache_lock:
+                del self._search_inflight[key]
+            pending.set_exception(e)
+            raise
+        
+        with self._search_cache_lock:
+            if results:
+                self._search_cache[key] = (time.monotonic() + self.search_cache_ttl, list(results))
+                self._search_cache.move_to_end(key)
+                while len(self._search_cache) > _SEARCH_CACHE_SIZE:
+                    self._search_cache.popitem(last=False)
+            del self._search_inflight[key]
+        pending.set_result(list(results))
+        return results
+    
+    def search_many(self, queries: List[SearchQuery],
+                    max_workers: int = 8) -> Dict[SearchQuery, List[SearchResult]]:
+        """
+        Run several searches against this source concurrently.
+        
+        All searches share this source's session and its host's token bucket,
+        so the overall request rate still follows ``rate_limit``; identical
+        queries are only searched once.
+        
+        Args:
+            queries: Search parameters for each search
+            max_workers: Maximum number of searches in flight
+            
+        Returns:
+            Dictionary mapping each query to its results
+        """
+        unique = list(dict.fromkeys(queries))
+        if not unique:
+            return {}
+        
+        results: Dict[SearchQuery, List[SearchResult]] = {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique)),
+                                thread_name_prefix="subsource") as executor:
+            future_to_query = {executor.submit(self.cached_search, query): query for query in unique}
+            for future in as_completed(future_to_query):
+                query = future_to_query[future]
+                try:
+                    results[query] = future.result()
+                except Exception as e:
+                    logger.error(f"{self.name} search failed for {query.title}: {e}")
+                    results[query] = []
+        return results
+    
+    async def search_async(self, query: SearchQuery,
+                           executor: Optional[Executor] = None) -> List[SearchResult]:
+        """
+        Search for subtitles without blocking the event loop.
+        
+        The blocking HTTP and parsing work runs on ``executor`` (the loop's
+        default executor if not given), so several sources can be awaited
+        together with ``asyncio.gather``.
+        
+        Args:
+            query: Search parameters
+            executor: Optional executor to run the search on
+            
+        Returns:
+            List of search results
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self.cached_search, query)
+    
+    async def download_async(self, result: SearchResult, output_path: Path,
+                             executor: Optional[Executor] = None) -> Path:
+        """
+        Download a subtitle file without blocking the event loop.
+        
+        Args:
+            result: Search result to download
+            output_path: Path to save the subtitle file
+            executor: Optional executor to run the download on
+            
+        Returns:
+            Path to the downloaded file
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self.download_subtitle, result, output_path)
 
 
 class TVSubtitlesSource(SubtitleSource):
     """TVSubtitles.net - Less aggressive anti-bot measures."""
     
-    def __init__(self):
+    def __init__(self, adapter: Optional[HTTPAdapter] = None):
         super().__init__(
             base_url="http://www.tvsubtitles.net",
             name="TVSubtitles",
-            rate_limit=2.0
+            rate_limit=2.0,
+            adapter=adapter
         )
     
     def search(self, query: SearchQuery) -> List[SearchResult]:
@@ -171,33 +548,44 @@ class TVSubtitlesSource(SubtitleSource):
             }
             
             response = self._make_request(search_url, params=params)
-            return self._parse_tvsubtitles_results(response.content, query)
+            return self._parse_tvsubtitles_results(response.content, query, _declared_encoding(response))
             
         except Exception as e:
             logger.error(f"TVSubtitles search failed: {e}")
             return []
     
-    def _parse_tvsubtitles_results(self, html_content: bytes, query: SearchQuery) -> List[SearchResult]:
+    def _parse_tvsubtitles_results(self, html_content: bytes, query: SearchQuery,
+                                   encoding: Optional[str] = None) -> List[SearchResult]:
         """Parse TVSubtitles search results."""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        if SELECTOLAX_AVAILABLE:
+            # (title, href) pairs via selectolax, filtered by the show URL pattern
+            links = HTMLParser(html_content).css('a[href*="/tvshow-"]')
+            show_links = [
+                (node.text(strip=True), node.attributes.get('href') or '')
+                for node in links
+                if _RE_TVSHOW.search(node.attributes.get('href') or '')
+            ][:query.limit]
+        else:
+            soup = BeautifulSoup(html_content, _HTML_PARSER, parse_only=_TVSHOW_LINKS, from_encoding=encoding)
+            show_links = [
+                (link.get_text(strip=True), link['href'])
+                for link in soup.find_all('a', href=_RE_TVSHOW, limit=query.limit)
+            ]
         results = []
         
         # Look for TV show links
-        show_links = soup.find_all('a', href=re.compile(r'/tvshow-\d+\.html'))
-        
-        for i, link in enumerate(show_links[:query.limit]):
+        for i, (title, href) in enumerate(show_links):
             try:
-                title = link.get_text(strip=True)
-                show_url = urljoin(self.base_url, link['href'])
+                show_url = urljoin(self.base_url, href)
                 
                 result = SearchResult(
                     id=f"tvsubtitles_{i}",
                     title=title,
+                    year=None,
                     source=SourceType.YIFY,  # Reuse enum value
                     language=query.language or 'en',
                     format=SubtitleFormat.SRT,
                     download_url=show_url,
-                    display_name=f"{title} (TVSubtitles)",
                     release_info="TV Show",
                     download_count=0,
                     file_size=None
@@ -215,27 +603,31 @@ class TVSubtitlesSource(SubtitleSource):
         """Download subtitle from TVSubtitles."""
         # This would need to be implemented to navigate to episode pages
         # For now, just create a placeholder
-        output_path.write_text("# TVSubtitles download not fully implemented yet\n")
-        return output_path
+        return self._write_bytes(output_path, b"# TVSubtitles download not fully implemented yet\n")
 
 class OpenSubtitlesSource(SubtitleSource):
     """OpenSubtitles.org subtitle source with REST API support."""
     
-    def __init__(self, api_key: Optional[str] = None, use_api: bool = False):
+    def __init__(self, api_key: Optional[str] = None, use_api: bool = False,
+                 adapter: Optional[HTTPAdapter] = None):
         """
         Initialize OpenSubtitles source.
         
         Args:
             api_key: Optional API key for REST API access
             use_api: Whether to use REST API (requires api_key) or web scraping
+            adapter: Optional connection pool shared with other sources
         """
         if use_api and api_key:
             super().__init__(
                 base_url="https://api.opensubtitles.com/api/v1",
                 name="OpenSubtitles API",
-                rate_limit=0.5  # API has higher rate limits
+                rate_limit=0.5,  # API has higher rate limits
+                adapter=adapter
             )
             self.use_api = True
+            # The API authenticates with the key header, not cookies
+            self.requires_session_warmup = False
             self.session.headers.update({
                 'Api-Key': api_key,
                 'Content-Type': 'application/json'
@@ -244,7 +636,8 @@ class OpenSubtitlesSource(SubtitleSource):
             super().__init__(
                 base_url="https://www.opensubtitles.org",
                 name="OpenSubtitles",
-                rate_limit=2.0  # Be more conservative with web scraping
+                rate_limit=2.0,  # Be more conservative with web scraping
+                adapter=adapter
             )
             self.use_api = False
         
@@ -276,46 +669,99 @@ class OpenSubtitlesSource(SubtitleSource):
         search_url = f"{self.base_url}/subtitles"
         response = self._make_request(search_url, params=search_params)
         
-        data = response.json()
+        data = _loads(response.content)
         return self._parse_api_results(data.get('data', []), query)
     
     def _search_web(self, query: SearchQuery) -> List[SearchResult]:
         """Search using web scraping (fallback method)."""
         search_url = self._build_search_url(query)
-        response = self._make_request(search_url)
         
-        return self._parse_search_results(response.content, query)
+        if LXML_AVAILABLE:
+            # Parse rows while the page is still downloading
+            response = self._make_request(search_url, stream=True)
+            try:
+                return self._parse_search_stream(response, query)
+            finally:
+                response.close()
+        
+        response = self._make_request(search_url)
+        return self._parse_search_results(response.content, query, _declared_encoding(response))
     
-    def _build_search_url(self, query: SearchQuery) -> str:
-        """Build search URL for OpenSubtitles."""
-        params = []
+    def _parse_search_stream(self, response: requests.Response, query: SearchQuery) -> List[SearchResult]:
+        """
+        Parse result rows incrementally from a streamed response.
+        
+        Stops reading as soon as ``query.limit`` rows have been seen, so the
+        rest of a long results page is never downloaded.
+        """
+        # Only trust an explicit charset; otherwise let lxml read the meta tag
+        content_type = response.headers.get('content-type', '')
+        encoding = response.encoding if 'charset=' in content_type.lower() else None
+        parser = etree.HTMLPullParser(events=('end',), tag='tr', encoding=encoding)
+        
+        results = []
+        index = 0
+        for chunk in response.iter_content(chunk_size=16 * 1024):
+            parser.feed(chunk)
+            for _, row in parser.read_events():
+                if not _RE_OS_ROW.search(row.get('id', '')):
+                    continue
+                try:
+                    result = self._parse_row_element(row, index)
+                    if result:
+                        results.append(result)
+                except Exception as e:
+                    logger.debug(f"Failed to parse subtitle row: {e}")
+                index += 1
+                row.clear()
+                if index >= query.limit:
+                    logger.info(f"Found {len(results)} OpenSubtitles results")
+                    return results
         
-        # Add title search
-        if query.title:
-            params.append(f"moviename={quote(query.title)}")
+        parser.close()
+        logger.info(f"Found {len(results)} OpenSubtitles results")
+        return results
+    
+    def _parse_row_element(self, row, index: int) -> Optional[SearchResult]:
+        """Parse a single subtitle row given as an lxml element."""
+        title_link = download_link = None
+        for link in row.iter('a'):
+            href = link.get('href', '')
+            if title_link is None and _RE_OS_SUBTITLES.search(href):
+                title_link = link
+            elif download_link is None and _RE_OS_SERVE.search(href):
+                download_link = link
         
-        # Add language filter
-        if query.language:
-            params.append(f"sublanguageid={query.language}")
+        if title_link is None or download_link is None:
+            return None
         
-        # Add season/episode if TV show
-        if query.season is not None:
-            params.append(f"season={query.season}")
-        if query.episode is not None:
-            params.append(f"episode={query.episode}")
+        release_info = None
+        for cell in row.iter('td'):
+            if 'MovieRelease' in (cell.get('class') or '').split():
+                release_info = ''.join(text.strip() for text in cell.itertext())
+                break
         
-        query_string = "&".join(params)
+        return self._build_result(
+            index,
+            ''.join(text.strip() for text in title_link.itertext()),
+            download_link.get('href'),
+            release_info
+        )
+    
+    def _build_search_url(self, query: SearchQuery) -> str:
+        """Build search URL for OpenSubtitles."""
         return f"{self.base_url}/en/search/sublanguageid-{query.language}/moviename-{quote(query.title)}"
     
-    def _parse_search_results(self, html_content: bytes, query: SearchQuery) -> List[SearchResult]:
-        """Parse search results from HTML."""
-        soup = BeautifulSoup(html_content, 'html.parser')
+    def _parse_search_results(self, html_content: bytes, query: SearchQuery,
+                              encoding: Optional[str] = None) -> List[SearchResult]:
+        """Parse search results from HTML (used when lxml is not installed)."""
+        soup = BeautifulSoup(html_content, _HTML_PARSER, parse_only=_OS_ROWS, from_encoding=encoding)
         results = []
         
         # Look for subtitle entries in the results table
-        subtitle_rows = soup.find_all('tr', {'id': re.compile(r'name\d+')})
+        subtitle_rows = soup.find_all('tr', {'id': _RE_OS_ROW}, limit=query.limit)
         
-        for i, row in enumerate(subtitle_rows[:query.limit]):
+        for i, row in enumerate(subtitle_rows):
             try:
                 result = self._parse_subtitle_row(row, i)
                 if result:
@@ -331,90 +777,71 @@ class OpenSubtitlesSource(SubtitleSource):
         """Parse a single subtitle row."""
         try:
             # Extract basic information
-            title_link = row.find('a', {'href': re.compile(r'/en/subtitles/')})
+            title_link = row.find('a', {'href': _RE_OS_SUBTITLES})
             if not title_link:
                 return None
             
             title = title_link.get_text(strip=True)
-            download_link = row.find('a', {'href': re.compile(r'/en/subtitleserve/')})
+            download_link = row.find('a', {'href': _RE_OS_SERVE})
             
             if not download_link:
                 return None
             
-            download_url = urljoin(self.base_url, download_link['href'])
-            
             # Extract additional metadata
             release_info = None
             release_cell = row.find('td', class_='MovieRelease')
             if release_cell:
                 release_info = release_cell.get_text(strip=True)
             
-            # Create search result
-            return SearchResult(
-                id=f"opensubtitles_{index}",
-                title=title,
-                year=None,  # Could be parsed from title if needed
-                language="en",  # Default, could be extracted
-                format=SubtitleFormat.SRT,  # Default format
-                source=SourceType.OPENSUBTITLES,
-                download_url=download_url,
-                release_info=release_info
-            )
+            return self._build_result(index, title, download_link['href'], release_info)
             
         except Exception as e:
             logger.debug(f"Failed to parse subtitle row: {e}")
             return None
     
+    def _build_result(self, index: int, title: str, href: str,
+                      release_info: Optional[str]) -> SearchResult:
+        """Create a search result from the fields of one results-table row."""
+        return SearchResult(
+            id=f"opensubtitles_{index}",
+            title=title,
+            year=None,  # Could be parsed from title if needed
+            language="en",  # Default, could be extracted
+            format=SubtitleFormat.SRT,  # Default format
+            source=SourceType.OPENSUBTITLES,
+            download_url=urljoin(self.base_url, href),
+            release_info=release_info
+        )
+    
     def download_subtitle(self, result: SearchResult, output_path: Path) -> Path:
         """Download subtitle from OpenSubtitles."""
         logger.info(f"Downloading subtitle: {result.display_name}")
         
         try:
-            response = self._make_request(result.download_url)
+            response = self._make_request(result.download_url, stream=True)
             
             # Handle different content types
             if response.headers.get('content-type', '').startswith('application/zip'):
                 # Extract from ZIP file
-                return self._extract_from_zip(response.content, output_path)
+                with self._spool_response(response) as archive:
+                    return self._extract_from_zip(archive, output_path)
             else:
                 # Direct subtitle file
-                output_path.write_bytes(response.content)
-                return output_path
+                return self._write_response(response, output_path)
                 
         except Exception as e:
             raise SubtitleSourceError(f"Download failed: {e}")
-    
-    def _extract_from_zip(self, zip_content: bytes, output_path: Path) -> Path:
-        """Extract subtitle from ZIP archive."""
-        with zipfile.ZipFile(io.BytesIO(zip_content)) as zf:
-            # Find subtitle files
-            subtitle_files = [f for f in zf.namelist() 
-                            if f.lower().endswith(('.srt', '.ass', '.ssa', '.vtt', '.sub'))]
-            
-            if not subtitle_files:
-                raise SubtitleSourceError("No subtitle files found in archive")
-            
-            # Extract the first subtitle file
-            subtitle_file = subtitle_files[0]
-            content = zf.read(subtitle_file)
-            
-            # Adjust output path extension if needed
-            original_ext = Path(subtitle_file).suffix
-            if output_path.suffix != original_ext:
-                output_path = output_path.with_suffix(original_ext)
-            
-            output_path.write_bytes(content)
-        return output_path
 
 
 class SubsceneSource(SubtitleSource):
     """Subscene.com subtitle source."""
     
-    def __init__(self):
+    def __init__(self, adapter: Optional[HTTPAdapter] = None):
         super().__init__(
             base_url="https://subscene.com",
             name="Subscene",
-            rate_limit=2.0
+            rate_limit=2.0,
+            adapter=adapter
         )
     
     def search(self, query: SearchQuery) -> List[SearchResult]:
@@ -429,27 +856,37 @@ class SubsceneSource(SubtitleSource):
             }
             
             # Subscene uses POST for search
-            response = self.session.post(search_url, data=data, timeout=30)
+            response = self.session.post(search_url, data=data, timeout=self.request_timeout)
             response.raise_for_status()
             
-            return self._parse_subscene_results(response.content, query)
+            return self._parse_subscene_results(response.content, query, _declared_encoding(response))
             
         except Exception as e:
             logger.error(f"Subscene search failed: {e}")
             return []
     
-    def _parse_subscene_results(self, html_content: bytes, query: SearchQuery) -> List[SearchResult]:
+    def _parse_subscene_results(self, html_content: bytes, query: SearchQuery,
+                                encoding: Optional[str] = None) -> List[SearchResult]:
         """Parse Subscene search results."""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        if SELECTOLAX_AVAILABLE:
+            # (title, href) pairs via selectolax CSS selectors
+            links = HTMLParser(html_content).css('a[href*="/subtitles/"]')
+            title_links = [
+                (node.text(strip=True), node.attributes.get('href', ''))
+                for node in islice(links, query.limit)
+            ]
+        else:
+            soup = BeautifulSoup(html_content, _HTML_PARSER, parse_only=_SUBSCENE_LINKS, from_encoding=encoding)
+            title_links = [
+                (link.get_text(strip=True), link['href'])
+                for link in soup.find_all('a', href=_RE_SUBSCENE, limit=query.limit)
+            ]
         results = []
         
         # Look for movie/TV show results
-        title_links = soup.find_all('a', href=re.compile(r'/subtitles/'))
-        
-        for i, link in enumerate(title_links[:query.limit]):
+        for i, (title, href) in enumerate(title_links):
             try:
-                title = link.get_text(strip=True)
-                detail_url = urljoin(self.base_url, link['href'])
+                detail_url = urljoin(self.base_url, href)
                 
                 result = SearchResult(
                     id=f"subscene_{i}",
@@ -476,18 +913,27 @@ class SubsceneSource(SubtitleSource):
         """Download subtitle from Subscene."""
         # This would need to be implemented to navigate to subtitle pages
         # For now, just create a placeholder
-        output_path.write_text("# Subscene download not fully implemented yet\n")
-        return output_path
+        return self._write_bytes(output_path, b"# Subscene download not fully implemented yet\n")
+
+
+@lru_cache(maxsize=1024)
+def _mock_seed(text: str) -> int:
+    """Derive a stable 32-bit random seed from a title or result ID."""
+    return int.from_bytes(hashlib.blake2b(text.encode(), digest_size=4).digest(), 'big')
 
 
 class MockSubtitleSource(SubtitleSource):
     """Mock subtitle source for testing and demonstration."""
     
-    def __init__(self):
+    requires_session_warmup = False
+    shares_host_quota = False  # Results are generated locally
+    
+    def __init__(self, adapter: Optional[HTTPAdapter] = None):
         super().__init__(
             base_url="https://www.opensubtitles.org",
             name="Mock Subtitle Source",
-            rate_limit=0.5
+            rate_limit=0.5,
+            adapter=adapter
         )
         
         # Common release types and video qualities
@@ -514,11 +960,9 @@ class MockSubtitleSource(SubtitleSource):
         """Mock search that generates realistic results based on the query."""
         logger.info(f"Mock searching for: {query.title}")
         import random
-        import hashlib
         
         # Use query title as seed for consistent results
-        seed = int(hashlib.md5(query.title.encode()).hexdigest()[:8], 16)
-        random.seed(seed)
+        random.seed(_mock_seed(query.title))
         
         found_results = []
         num_results = min(query.limit, random.randint(2, 5))
@@ -540,39 +984,37 @@ class MockSubtitleSource(SubtitleSource):
     
     def _detect_tv_show(self, title: str) -> bool:
         """Detect if the title appears to be a TV show."""
-        tv_indicators = ['s01', 's1', 'season', 'episode', 'series', 'tv', 'show']
-        title_lower = title.lower()
-        return any(indicator in title_lower for indicator in tv_indicators)
+        return _RE_TV_INDICATOR.search(title) is not None
     
     def _extract_year_from_title(self, title: str) -> Optional[int]:
         """Extract year from title if present."""
-        import re
-        year_match = re.search(r'(19|20)\d{2}', title)
+        year_match = _RE_YEAR.search(title)
         return int(year_match.group()) if year_match else None
     
     def _clean_title(self, title: str) -> str:
         """Clean the title by removing year and extra info."""
-        import re
         # Remove year in parentheses or standalone
-        cleaned = re.sub(r'\b(19|20)\d{2}\b', '', title)
+        cleaned = _RE_STANDALONE_YEAR.sub('', title)
         # Remove common prefixes/suffixes
-        cleaned = re.sub(r'\s*-\s*(season|series|tv|show).*$', '', cleaned, flags=re.IGNORECASE)
+        cleaned = _RE_SHOW_SUFFIX.sub('', cleaned)
         return cleaned.strip()
     
     def _create_url_slug(self, title: str, year: int) -> str:
         """Create URL-friendly slug for OpenSubtitles URLs."""
-        import re
-        
         # Convert to lowercase and replace spaces/special chars with hyphens
         slug = title.lower()
-        slug = re.sub(r'[^a-z0-9\s-]', '', slug)  # Remove special characters
-        slug = re.sub(r'\s+', '-', slug)  # Replace spaces with hyphens
-        slug = re.sub(r'-+', '-', slug)  # Remove multiple consecutive hyphens
+        slug = _RE_SLUG_INVALID.sub('', slug)  # Remove special characters
+        slug = _RE_SLUG_SEPARATORS.sub('-', slug)  # Collapse spaces and hyphens into one hyphen
         slug = slug.strip('-')  # Remove leading/trailing hyphens
         
         # Add year to make it more realistic
         return f"{year}-{slug}"
     
+    def _search_url(self, title: str) -> str:
+        """Build an OpenSubtitles search URL, treating hyphens as spaces."""
+        # Format: https://www.opensubtitles.org/en/search/sublanguageid-all/moviename-{title}
+        return f"{self.base_url}/en/search/sublanguageid-all/moviename-{quote(title.replace('-', ' '), safe='')}"
+    
     def _generate_movie_result(self, title: str, query: SearchQuery, index: int, year: int) -> SearchResult:
         """Generate a realistic movie subtitle result."""
         import random
@@ -586,9 +1028,7 @@ class MockSubtitleSource(SubtitleSource):
         file_size = random.randint(40000, 120000)
         
         # Create realistic OpenSubtitles search URL
-        # Format: https://www.opensubtitles.org/en/search/sublanguageid-all/moviename-{title}
-        title_encoded = title.replace(' ', '%20').replace('-', '%20')
-        download_url = f"https://www.opensubtitles.org/en/search/sublanguageid-all/moviename-{title_encoded}"
+        download_url = self._search_url(title)
         
         return SearchResult(
             id=f"mock_movie_{index}",
@@ -625,9 +1065,7 @@ class MockSubtitleSource(SubtitleSource):
         file_size = random.randint(25000, 60000)
         
         # Create realistic OpenSubtitles search URL for TV shows
-        # Format: https://www.opensubtitles.org/en/search/sublanguageid-all/moviename-{title}
-        title_encoded = title.replace(' ', '%20').replace('-', '%20')
-        download_url = f"https://www.opensubtitles.org/en/search/sublanguageid-all/moviename-{title_encoded}"
+        download_url = self._search_url(title)
         
         full_title = f"{title} {episode_str} - {episode_title}"
         
@@ -649,65 +1087,52 @@ class MockSubtitleSource(SubtitleSource):
     def download_subtitle(self, result: SearchResult, output_path: Path) -> Path:
         """Create a generic mock subtitle file."""
         import random
-        import hashlib
         
         # Use result ID as seed for consistent content
-        seed = int(hashlib.md5(result.id.encode()).hexdigest()[:8], 16)
-        random.seed(seed)
-        
-        # Generate completely generic subtitle content
-        lines = []
-        start_time = 0
+        random.seed(_mock_seed(result.id))
         
         # Generate 8-15 subtitle entries with generic placeholder text
         num_lines = random.randint(8, 15)
         
-        for i in range(1, num_lines + 1):
-            end_time = start_time + random.randint(2000, 6000)  # 2-6 seconds per subtitle
-            
-            # Format time as SRT timestamp
-            start_ts = self._format_timestamp(start_time)
-            end_ts = self._format_timestamp(end_time)
-            
-            # Create generic subtitle text
-            subtitle_text = f"[Subtitle line {i} for {result.title}]"
-            
-            lines.extend([
-                str(i),
-                f"{start_ts} --> {end_ts}",
-                subtitle_text,
-                ""  # Empty line separator
-            ])
-            
-            start_time = end_time + random.randint(500, 2000)  # Gap between subtitles
+        # Draw (duration, gap) pairs up front: 2-6 seconds per subtitle, 0.5-2s between
+        timings = [(random.randint(2000, 6000), random.randint(500, 2000)) for _ in range(num_lines)]
+        
+        # Build each cue as one string and join once at the end
+        cues = []
+        start_time = 0
+        for i, (duration, gap) in enumerate(timings, 1):
+            end_time = start_time + duration
+            cues.append(
+                f"{i}\n{self._format_timestamp(start_time)} --> {self._format_timestamp(end_time)}\n"
+                f"[Subtitle line {i} for {result.title}]\n"
+            )
+            start_time = end_time + gap
         
         # Add header comment
         header = f"# Mock subtitle file for: {result.title}\n# Generated by Swahili Subtitle Translator\n# Source: {result.source.value}\n# Release: {result.release_info}\n\n"
         
-        content = header + "\n".join(lines)
-        output_path.write_text(content, encoding='utf-8')
+        content = header + "\n".join(cues)
+        self._write_bytes(output_path, content.encode('utf-8'))
         logger.info(f"Created mock subtitle file: {output_path}")
         return output_path
     
     def _format_timestamp(self, milliseconds: int) -> str:
         """Format milliseconds as SRT timestamp (HH:MM:SS,mmm)."""
-        hours = milliseconds // 3600000
-        minutes = (milliseconds % 3600000) // 60000
-        seconds = (milliseconds % 60000) // 1000
-        ms = milliseconds % 1000
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d},{ms:03d}"
+        seconds, ms = divmod(milliseconds, 1000)
+        minutes, seconds = divmod(seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        return "%02d:%02d:%02d,%03d" % (hours, minutes, seconds, ms)
 
 
-# Duplicate OpenSubtitles class removed - was incorrectly implementing Subscene
-# The correct OpenSubtitles implementation is above at line 221
 class YIFYSubtitlesSource(SubtitleSource):
     """YIFY Subtitles source."""
     
-    def __init__(self):
+    def __init__(self, adapter: Optional[HTTPAdapter] = None):
         super().__init__(
             base_url="https://yifysubtitles.org",
             name="YIFY Subtitles",
-            rate_limit=1.5
+            rate_limit=1.5,
+            adapter=adapter
         )
     
     def search(self, query: SearchQuery) -> List[SearchResult]:
@@ -720,24 +1145,35 @@ class YIFYSubtitlesSource(SubtitleSource):
             params = {'q': query.title}
             
             response = self._make_request(search_url, params=params)
-            return self._parse_search_results(response.content, query)
+            return self._parse_search_results(response.content, query, _declared_encoding(response))
             
         except Exception as e:
             logger.error(f"YIFY search failed: {e}")
             return []
     
-    def _parse_search_results(self, html_content: bytes, query: SearchQuery) -> List[SearchResult]:
+    def _parse_search_results(self, html_content: bytes, query: SearchQuery,
+                              encoding: Optional[str] = None) -> List[SearchResult]:
         """Parse YIFY search results."""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        if SELECTOLAX_AVAILABLE:
+            # (title, href) pairs via selectolax CSS selectors
+            links = HTMLParser(html_content).css('a[href*="/movie-imdb/"]')
+            movie_links = [
+                (node.text(strip=True), node.attributes.get('href', ''))
+                for node in islice(links, query.limit)
+            ]
+        else:
+            soup = BeautifulSoup(html_content, _HTML_PARSER, parse_only=_YIFY_MOVIE_LINKS,
+                                 from_encoding=encoding)
+            movie_links = [
+                (link.get_text(strip=True), link['href'])
+                for link in soup.find_all('a', {'href': _RE_YIFY_MOVIE}, limit=query.limit)
+            ]
         results = []
         
         # Find movie cards or links
-        movie_links = soup.find_all('a', {'href': re.compile(r'/movie-imdb/')})
-        
-        for i, link in enumerate(movie_links[:query.limit]):
+        for i, (title, href) in enumerate(movie_links):
             try:
-                title = link.get_text(strip=True)
-                detail_url = urljoin(self.base_url, link['href'])
+                detail_url = urljoin(self.base_url, href)
                 
                 result = SearchResult(
                     id=f"yify_{i}",
@@ -764,42 +1200,28 @@ class YIFYSubtitlesSource(SubtitleSource):
         try:
             # Get movie detail page
             response = self._make_request(result.download_url)
-            soup = BeautifulSoup(response.content, 'html.parser')
             
-            # Find subtitle download links
-            download_links = soup.find_all('a', {'href': re.compile(r'/subtitle/')})
-            if not download_links:
-                raise SubtitleSourceError("No subtitle download links found")
+            # Use first available subtitle; a byte-level match avoids building a tree
+            match = _RE_YIFY_SUB_HREF.search(response.content)
+            if match:
+                href = html.unescape(match.group(1).decode('utf-8', 'replace'))
+            else:
+                soup = BeautifulSoup(response.content, _HTML_PARSER, parse_only=_YIFY_SUB_LINKS,
+                                     from_encoding=_declared_encoding(response))
+                download_link = soup.find('a', {'href': _RE_YIFY_SUB})
+                if not download_link:
+                    raise SubtitleSourceError("No subtitle download links found")
+                href = download_link['href']
             
-            # Use first available subtitle
-            download_url = urljoin(self.base_url, download_links[0]['href'])
-            response = self._make_request(download_url)
+            download_url = urljoin(self.base_url, href)
+            response = self._make_request(download_url, stream=True)
             
             # Handle ZIP files
             if response.headers.get('content-type', '').startswith('application/zip'):
-                return self._extract_from_zip(response.content, output_path)
+                with self._spool_response(response) as archive:
+                    return self._extract_from_zip(archive, output_path)
             else:
-                output_path.write_bytes(response.content)
-                return output_path
+                return self._write_response(response, output_path)
                 
         except Exception as e:
             raise SubtitleSourceError(f"YIFY download failed: {e}")
-    
-    def _extract_from_zip(self, zip_content: bytes, output_path: Path) -> Path:
-        """Extract subtitle from ZIP (same implementation)."""
-        with zipfile.ZipFile(io.BytesIO(zip_content)) as zf:
-            subtitle_files = [f for f in zf.namelist() 
-                            if f.lower().endswith(('.srt', '.ass', '.ssa', '.vtt', '.sub'))]
-            
-            if not subtitle_files:
-                raise SubtitleSourceError("No subtitle files found in archive")
-            
-            subtitle_file = subtitle_files[0]
-            content = zf.read(subtitle_file)
-            
-            original_ext = Path(subtitle_file).suffix
-            if output_path.suffix != original_ext:
-                output_path = output_path.with_suffix(original_ext)
-            
-            output_path.write_bytes(content)
-            return output_path
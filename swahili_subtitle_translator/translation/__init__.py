@@ -13,6 +13,7 @@ from .models import (
     SubtitleEntry,
     SubtitleFile,
     LANGUAGE_MAPPINGS,
+    PHRASE_GLOSSARY,
     QUALITY_THRESHOLDS,
     get_language_name
 )
@@ -59,6 +60,7 @@ __all__ = [
     "SubtitleEntry",
     "SubtitleFile",
     "LANGUAGE_MAPPINGS",
+    "PHRASE_GLOSSARY",
     "QUALITY_THRESHOLDS",
     "get_language_name",
     
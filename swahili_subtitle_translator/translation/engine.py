@@ -2,10 +2,19 @@
 Translation engine that coordinates multiple translation services.
 """
 
+import re
+import asyncio
 import logging
-from typing import List, Dict, Optional, Union, Callable
+import random
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import replace
+from functools import partial
+from typing import List, Dict, Optional, Union, Callable, Tuple
 from datetime import datetime
 import time
+from concurrent.futures import Executor, ThreadPoolExecutor, wait, as_completed, FIRST_COMPLETED, TimeoutError as FuturesTimeoutError
 
 from .models import (
     TranslationRequest,
@@ -15,6 +24,7 @@ from .models import (
     TranslationService,
     LanguageCode,
     SubtitleFile,
+    PHRASE_GLOSSARY,
     QUALITY_THRESHOLDS
 )
 from .services import (
@@ -23,9 +33,30 @@ from .services import (
     TranslationServiceError
 )
 from ..utils.exceptions import SubtitleTranslatorError
+from ..utils.rate_limit import CircuitBreaker
 
 logger = logging.getLogger(__name__)
 
+# Services whose calls are dominated by network round trips
+_NETWORK_SERVICES = frozenset({
+    TranslationService.GOOGLE_TRANSLATE,
+    TranslationService.OPENAI_GPT,
+    TranslationService.AZURE_TRANSLATOR
+})
+
+# Errors worth retrying on the same service: throttling, quotas and server hiccups
+_TRANSIENT_ERROR = re.compile(
+    r'\b(?:429|500|502|503|504)\b|rate.?limit|quota|too many requests|timed? ?out',
+    re.IGNORECASE
+)
+
+# Services are skipped for a while after this many consecutive failed calls
+_SERVICE_FAILURE_THRESHOLD = 5
+_SERVICE_COOLDOWN = 30.0
+
+# Overall deadline when high-priority requests go to every service at once
+_PARALLEL_TIMEOUT = 60.0
+
 
 class TranslationEngineError(SubtitleTranslatorError):
     """Exception raised by translation engine."""
@@ -43,7 +74,12 @@ class TranslationEngine:
                  service_configs: Optional[Dict[TranslationService, Dict]] = None,
                  default_service: TranslationService = TranslationService.GOOGLE_TRANSLATE,
                  fallback_services: Optional[List[TranslationService]] = None,
-                 quality_threshold: float = 0.6):
+                 quality_threshold: float = 0.6,
+                 max_concurrency: int = 8,
+                 hedge_delay: Optional[float] = None,
+                 hedge_priority_threshold: Optional[float] = None,
+                 cache_size: int = 10000,
+                 glossary: Optional[Dict[Tuple[LanguageCode, LanguageCode], Dict[str, str]]] = None):
         """
         Initialize the translation engine.
         
@@ -52,11 +88,39 @@ class TranslationEngine:
             default_service: Primary service to use
             fallback_services: Services to try if primary fails
             quality_threshold: Minimum acceptable translation quality
+            max_concurrency: Maximum concurrent requests to network services in batches
+            hedge_delay: Seconds to wait on the primary service in ``translate``
+                before also trying the next network fallback (None disables hedging)
+            hedge_priority_threshold: Requests with at least this priority are sent to
+                every real service at once and the answer from the service
+                earliest in the configured order is kept (None disables this)
+            cache_size: Maximum number of translations remembered by ``translate``
+                (0 disables caching)
+            glossary: Extra exact phrase translations per (source, target) language
+                pair, added to (or overriding) the built-in ``PHRASE_GLOSSARY``
         """
         self.service_configs = service_configs or {}
+        
         self.default_service = default_service
         self.fallback_services = fallback_services or [TranslationService.OFFLINE_MODEL, TranslationService.MOCK]
         self.quality_threshold = quality_threshold
+        self.max_concurrency = max(1, max_concurrency)
+        self.hedge_delay = hedge_delay
+        self.hedge_priority_threshold = hedge_priority_threshold
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._breaker = CircuitBreaker(_SERVICE_FAILURE_THRESHOLD, _SERVICE_COOLDOWN)
+        
+        # Primary-service translations by (text, languages, context, service), least recently used first
+        self.cache_size = cache_size
+        self._result_cache: "OrderedDict[tuple, TranslationResponse]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # Exact phrase translations that never need a service call
+        self.glossary = {pair: dict(phrases) for pair, phrases in PHRASE_GLOSSARY.items()}
+        for pair, phrases in (glossary or {}).items():
+            self.glossary.setdefault(pair, {}).update(
+                (phrase.strip().rstrip('.!?').lower(), translation) for phrase, translation in phrases.items()
+            )
         
         # Service instances
         self.services: Dict[TranslationService, BaseTranslationService] = {}
@@ -67,10 +131,16 @@ class TranslationEngine:
             'successful_translations': 0,
             'failed_translations': 0,
             'fallback_used': 0,
+            'cache_hits': 0,
+            'glossary_hits': 0,
             'total_cost': 0.0,
             'average_quality': 0.0,
             'service_usage': {}
         }
+        # Number of translations that contributed to average_quality
+        self._quality_samples = 0
+        # Batch workers and hedged calls update statistics from several threads
+        self._stats_lock = threading.Lock()
         
         self._initialize_services()
         
@@ -125,10 +195,59 @@ class TranslationEngine:
         if isinstance(request, str):
             request = TranslationRequest(text=request)
         
+        # A pinned service is always asked; otherwise known phrases are answered locally
+        if preferred_service is None:
+            response = self._glossary_response(request.text, request.source_language,
+                                               request.target_language, request.id)
+            if response is not None:
+                self._update_stats(response, response.service, is_fallback=False)
+                self._increment_stat('glossary_hits')
+                return response
+        
+        key = self._cache_key(request, preferred_service, use_fallbacks)
+        cached = self._get_cached(key)
+        if cached is not None:
+            # Nothing was sent to a service, so nothing was spent
+            response = replace(cached, request_id=request.id, cost_estimate=0.0)
+            self._update_stats(response, response.service, is_fallback=False)
+            self._increment_stat('cache_hits')
+            return response
+        
+        response = self._translate_uncached(request, preferred_service, use_fallbacks)
+        if self._is_cacheable(response, preferred_service):
+            self._set_cached(key, response)
+        return response
+    
+    def _translate_uncached(self,
+                            request: TranslationRequest,
+                            preferred_service: Optional[TranslationService],
+                            use_fallbacks: bool) -> TranslationResponse:
+        """Translate a single request, trying services until one succeeds."""
         # Determine service order
         services_to_try = self._get_service_order(preferred_service, use_fallbacks)
         
         last_error = None
+        if (self.hedge_priority_threshold is not None and use_fallbacks
+                and request.priority >= self.hedge_priority_threshold):
+            # The mock service only produces placeholders, so it stays the last resort
+            raced = [s for s in services_to_try if s != TranslationService.MOCK]
+            response, last_error = self._translate_with_all(request, raced)
+            if response is not None:
+                self._update_stats(response, response.service,
+                                   is_fallback=response.service != self.default_service)
+                return response
+            services_to_try = [s for s in services_to_try if s not in raced]
+        elif self.hedge_delay is not None and use_fallbacks:
+            # Only race two real providers; a local placeholder would always win
+            hedged = [s for s in services_to_try if s in _NETWORK_SERVICES][:2]
+            if len(hedged) == 2 and hedged[0] == services_to_try[0]:
+                response, tried, last_error = self._translate_hedged(request, *hedged)
+                if response is not None:
+                    self._update_stats(response, response.service,
+                                       is_fallback=response.service != self.default_service)
+                    return response
+                services_to_try = [s for s in services_to_try if s not in tried]
+        
         for service_type in services_to_try:
             if service_type not in self.services:
                 continue
@@ -137,7 +256,7 @@ class TranslationEngine:
                 service = self.services[service_type]
                 logger.info(f"Attempting translation with {service_type.value}")
                 
-                response = service.translate(request)
+                response = self._call_with_retry(service, request)
                 
                 if response.success and self._is_quality_acceptable(response):
                     # Update statistics
@@ -153,7 +272,7 @@ class TranslationEngine:
                 continue
         
         # All services failed
-        self.translation_stats['failed_translations'] += 1
+        self._increment_stat('failed_translations')
         
         error_response = TranslationResponse(
             request_id=request.id,
@@ -168,6 +287,83 @@ class TranslationEngine:
         
         return error_response
     
+    def _glossary_response(self, text: str,
+                           source_language: LanguageCode,
+                           target_language: LanguageCode,
+                           request_id: Optional[str] = None) -> Optional[TranslationResponse]:
+        """Translate a short phrase from the glossary, keeping its trailing punctuation."""
+        phrases = self.glossary.get((source_language, target_language))
+        if not phrases:
+            return None
+        
+        stripped = text.strip()
+        phrase = stripped.rstrip('.!?')
+        translated = phrases.get(phrase.lower())
+        if translated is None:
+            return None
+        
+        return TranslationResponse(
+            request_id=request_id or str(uuid.uuid4()),
+            translated_text=translated + stripped[len(phrase):],
+            source_text=text,
+            source_language=source_language,
+            target_language=target_language,
+            service=TranslationService.GLOSSARY,  # Local lookup, no service call
+            confidence_score=1.0,
+            service_response_time=0.0,
+            cost_estimate=0.0,
+            completed_at=datetime.now()
+        )
+    
+    def _cache_key(self, request: TranslationRequest,
+                   preferred_service: Optional[TranslationService],
+                   use_fallbacks: bool) -> tuple:
+        """Build the result cache key for a request."""
+        return (request.text, request.source_language.value, request.target_language.value,
+                request.context, request.domain, preferred_service, use_fallbacks)
+    
+    def _is_cacheable(self, response: TranslationResponse,
+                      preferred_service: Optional[TranslationService]) -> bool:
+        """
+        Check whether a response may be served again from the result cache.
+        
+        Only good answers from the request's primary service are kept, so
+        fallback output (e.g. mock placeholders during an outage) is not
+        served once the primary service has recovered.
+        """
+        primary = preferred_service if preferred_service in self.services else self.default_service
+        return (response.success
+                and response.service == primary
+                and response.service != TranslationService.MOCK
+                and self._is_quality_acceptable(response))
+    
+    def _get_cached(self, key: tuple) -> Optional[TranslationResponse]:
+        """Return a remembered translation, if there is one."""
+        if self.cache_size <= 0:
+            return None
+        
+        with self._cache_lock:
+            response = self._result_cache.get(key)
+            if response is not None:
+                self._result_cache.move_to_end(key)
+        return response
+    
+    def _set_cached(self, key: tuple, response: TranslationResponse):
+        """Remember a translation; failed translations are not cached."""
+        if self.cache_size <= 0 or not response.success:
+            return
+        
+        with self._cache_lock:
+            self._result_cache[key] = response
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > self.cache_size:
+                self._result_cache.popitem(last=False)
+    
+    def clear_cache(self):
+        """Forget all remembered translations."""
+        with self._cache_lock:
+            self._result_cache.clear()
+    
     def translate_batch(self,
                        request: Union[BatchTranslationRequest, List[str]],
                        preferred_service: Optional[TranslationService] = None,
@@ -198,22 +394,56 @@ class TranslationEngine:
         if service_type not in self.services:
             service_type = TranslationService.MOCK
         
+        # Don't send every line to a service that is known to be down
+        if self._breaker.is_open(service_type.value):
+            skipped = service_type
+            service_type = self._get_service_order(preferred_service, use_fallbacks)[0]
+            logger.warning(f"{skipped.value} is temporarily disabled, translating batch with {service_type.value}")
+        
         service = self.services[service_type]
         
+        # Glossary phrases are answered locally (unless a service was pinned);
+        # only the rest go to the service
+        glossary_hits = {}
+        if preferred_service is None:
+            for i, text in enumerate(request.texts):
+                hit = self._glossary_response(text, request.source_language, request.target_language)
+                if hit is not None:
+                    glossary_hits[i] = hit
+        if glossary_hits:
+            logger.info(f"Resolved {len(glossary_hits)} texts from the glossary")
+            self._increment_stat('glossary_hits', len(glossary_hits))
+            service_request = replace(request, texts=[
+                text for i, text in enumerate(request.texts) if i not in glossary_hits
+            ])
+        else:
+            service_request = request
+        
         try:
-            # Use service's batch translation if available
-            response = service.translate_batch(request)
+            # Use service's batch translation, overlapping requests to network services;
+            # each text gets the same transient-error retries as a single translation
+            max_workers = self.max_concurrency if service_type in _NETWORK_SERVICES else 1
+            response = service.translate_batch(service_request, max_workers=max_workers,
+                                               translate_fn=partial(self._call_with_retry, service))
             
             # If some translations failed and fallbacks are enabled, retry failed ones
             if use_fallbacks and response.failed_translations > 0:
-                response = self._retry_failed_translations(response, request)
+                response = self._retry_failed_translations(response, service_request)
+            
+            # Put glossary translations back in their original positions
+            if glossary_hits:
+                service_translations = iter(response.translations)
+                response = replace(response, translations=[
+                    glossary_hits[i] if i in glossary_hits else next(service_translations)
+                    for i in range(len(request.texts))
+                ])
             
             # Update statistics
             for translation in response.translations:
                 if translation.success:
                     self._update_stats(translation, translation.service, is_fallback=False)
                 else:
-                    self.translation_stats['failed_translations'] += 1
+                    self._increment_stat('failed_translations')
             
             # Call progress callback if provided
             if progress_callback:
@@ -241,6 +471,109 @@ class TranslationEngine:
                 completed_at=datetime.now()
             )
     
+    async def translate_async(self,
+                              request: Union[TranslationRequest, str],
+                              preferred_service: Optional[TranslationService] = None,
+                              use_fallbacks: bool = True,
+                              executor: Optional[Executor] = None) -> TranslationResponse:
+        """
+        Translate a single text without blocking the event loop.
+        
+        The blocking service call runs on ``executor`` (the loop's default
+        executor if not given).
+        
+        Args:
+            request: Translation request or plain text
+            preferred_service: Preferred service to use
+            use_fallbacks: Whether to use fallback services
+            executor: Optional executor to run the translation on
+            
+        Returns:
+            Translation response
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self.translate, request,
+                                          preferred_service, use_fallbacks)
+    
+    async def translate_batch_async(self,
+                                    request: Union[BatchTranslationRequest, List[str]],
+                                    preferred_service: Optional[TranslationService] = None,
+                                    use_fallbacks: bool = True,
+                                    executor: Optional[Executor] = None) -> BatchTranslationResponse:
+        """
+        Translate multiple texts from an event loop.
+        
+        Texts are translated individually with at most ``max_concurrency``
+        in flight, so glossary hits, cached results, fallbacks and the
+        circuit breaker apply to each text as in ``translate``.
+        
+        Args:
+            request: Batch request or list of texts
+            preferred_service: Preferred service to use
+            use_fallbacks: Whether to use fallback services
+            executor: Optional executor to run the translations on
+            
+        Returns:
+            Batch translation response, in the order of the input texts
+        """
+        start_time = time.time()
+        
+        if isinstance(request, list):
+            request = BatchTranslationRequest(texts=request)
+        
+        logger.info(f"Starting async batch translation of {len(request.texts)} texts")
+        
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def translate_one(text: str) -> TranslationResponse:
+            async with semaphore:
+                return await self.translate_async(
+                    TranslationRequest(
+                        text=text,
+                        source_language=request.source_language,
+                        target_language=request.target_language,
+                        preserve_formatting=request.preserve_formatting,
+                        context=request.context,
+                        domain=request.domain
+                    ),
+                    preferred_service, use_fallbacks, executor
+                )
+        
+        results = await asyncio.gather(*(translate_one(text) for text in request.texts),
+                                       return_exceptions=True)
+        
+        translations = []
+        for text, result in zip(request.texts, results):
+            if isinstance(result, Exception):
+                logger.error(f"Async translation failed: {result}")
+                self._increment_stat('failed_translations')
+                result = TranslationResponse(
+                    request_id=str(uuid.uuid4()),
+                    translated_text="",
+                    source_text=text,
+                    source_language=request.source_language,
+                    target_language=request.target_language,
+                    service=preferred_service or self.default_service,
+                    success=False,
+                    error=str(result)
+                )
+            translations.append(result)
+        
+        response = BatchTranslationResponse(
+            request_id=request.id,
+            translations=translations,
+            source_language=request.source_language,
+            target_language=request.target_language,
+            service=preferred_service or self.default_service,
+            total_processing_time=time.time() - start_time,
+            completed=True,
+            completed_at=datetime.now()
+        )
+        
+        logger.info(f"Async batch translation completed: {response.successful_translations}/{response.total_texts} successful")
+        
+        return response
+    
     def translate_subtitle_file(self,
                                subtitle_file: SubtitleFile,
                                target_language: LanguageCode = LanguageCode.SWAHILI,
@@ -263,9 +596,14 @@ class TranslationEngine:
         # Extract texts for translation
         texts = subtitle_file.get_text_for_translation()
         
+        # Repeated lines ("Yes.", names, ...) are only sent once
+        unique_texts = list(dict.fromkeys(texts))
+        if len(unique_texts) < len(texts):
+            logger.info(f"Translating {len(unique_texts)} unique texts out of {len(texts)}")
+        
         # Create batch request
         batch_request = BatchTranslationRequest(
-            texts=texts,
+            texts=unique_texts,
             source_language=subtitle_file.source_language,
             target_language=target_language,
             domain="movie",  # Subtitle context
@@ -282,22 +620,18 @@ class TranslationEngine:
         # Apply successful translations
         successful_translations = batch_response.get_successful_translations()
         if successful_translations:
-            translated_texts = [t.translated_text for t in successful_translations]
+            # Translations come back in the order of the unique texts
+            translated_by_text = {
+                text: translation.translated_text
+                for text, translation in zip(unique_texts, batch_response.translations)
+                if translation.success
+            }
             
             # Handle partial failures by filling gaps with original text
-            if len(translated_texts) < len(texts):
-                logger.warning(f"Some translations failed, using original text for {len(texts) - len(translated_texts)} entries")
-                complete_translations = []
-                success_index = 0
-                
-                for i, original_text in enumerate(texts):
-                    if success_index < len(successful_translations) and successful_translations[success_index].source_text == original_text:
-                        complete_translations.append(successful_translations[success_index].translated_text)
-                        success_index += 1
-                    else:
-                        complete_translations.append(original_text)  # Use original if translation failed
-                
-                translated_texts = complete_translations
+            translated_texts = [translated_by_text.get(text, text) for text in texts]
+            untranslated = sum(1 for text in texts if text not in translated_by_text)
+            if untranslated:
+                logger.warning(f"Some translations failed, using original text for {untranslated} entries")
             
             subtitle_file.apply_translations(translated_texts)
             subtitle_file.target_language = target_language
@@ -317,19 +651,24 @@ class TranslationEngine:
                           preferred_service: Optional[TranslationService],
                           use_fallbacks: bool) -> List[TranslationService]:
         """Get ordered list of services to try."""
-        services = []
+        order = []
         
         # Add preferred service first
         if preferred_service and preferred_service in self.services:
-            services.append(preferred_service)
+            order.append(preferred_service)
         elif self.default_service in self.services:
-            services.append(self.default_service)
+            order.append(self.default_service)
         
         # Add fallback services if enabled
         if use_fallbacks:
+            seen = set(order)
             for service in self.fallback_services:
-                if service not in services and service in self.services:
-                    services.append(service)
+                if service not in seen and service in self.services:
+                    order.append(service)
+                    seen.add(service)
+        
+        # Skip services whose circuit is open
+        services = [s for s in order if not self._breaker.is_open(s.value)]
         
         # Ensure mock service is last resort
         if TranslationService.MOCK not in services:
@@ -337,6 +676,151 @@ class TranslationEngine:
         
         return services
     
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the engine's worker pool, creating it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                                thread_name_prefix="translation")
+        return self._executor
+    
+    def _translate_hedged(self,
+                          request: TranslationRequest,
+                          primary: TranslationService,
+                          secondary: TranslationService
+                          ) -> Tuple[Optional[TranslationResponse], List[TranslationService], Optional[str]]:
+        """
+        Translate with the primary service, hedging with the secondary if it is slow.
+        
+        The secondary is only started if the primary hasn't finished within
+        ``hedge_delay`` seconds; the first acceptable response wins.
+        
+        Returns:
+            Winning response (None if none was acceptable), the services
+            that were tried, and the last error seen
+        """
+        executor = self._get_executor()
+        futures = {executor.submit(self._call_with_retry, self.services[primary], request): primary}
+        
+        done, _ = wait(futures, timeout=self.hedge_delay)
+        if not done:
+            logger.info(f"{primary.value} slower than {self.hedge_delay}s, hedging with {secondary.value}")
+            futures[executor.submit(self._call_with_retry, self.services[secondary], request)] = secondary
+        
+        last_error = None
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    response = future.result()
+                except Exception as e:
+                    logger.error(f"Service {futures[future].value} failed: {e}")
+                    last_error = str(e)
+                    continue
+                
+                if response.success and self._is_quality_acceptable(response):
+                    # Losers still running can't be interrupted; their results are ignored
+                    for other in pending:
+                        other.cancel()
+                    return response, list(futures.values()), None
+                last_error = response.error or "Quality below threshold"
+        
+        return None, list(futures.values()), last_error
+    
+    def _translate_with_all(self,
+                            request: TranslationRequest,
+                            services_to_try: List[TranslationService]
+                            ) -> Tuple[Optional[TranslationResponse], Optional[str]]:
+        """
+        Send a request to every service at once and keep the preferred answer.
+        
+        Confidence scores are fixed per provider rather than measured, so
+        they can't be compared across services; the acceptable answer from
+        the service earliest in ``services_to_try`` wins. The cost of the
+        answers that were not kept is still added to the engine's total cost.
+        
+        Returns:
+            Best acceptable response (None if there was none) and the last error seen
+        """
+        executor = self._get_executor()
+        futures = {
+            executor.submit(self._call_with_retry, self.services[service_type], request): service_type
+            for service_type in services_to_try if service_type in self.services
+        }
+        
+        acceptable: List[TranslationResponse] = []
+        last_error = None
+        try:
+            for future in as_completed(futures, timeout=_PARALLEL_TIMEOUT):
+                try:
+                    response = future.result()
+                except Exception as e:
+                    logger.error(f"Service {futures[future].value} failed: {e}")
+                    last_error = str(e)
+                    continue
+                
+                if response.success and self._is_quality_acceptable(response):
+                    acceptable.append(response)
+                else:
+                    last_error = response.error or "Quality below threshold"
+        except FuturesTimeoutError:
+            last_error = f"Timed out after {_PARALLEL_TIMEOUT}s"
+            logger.warning(f"Parallel translation timed out, using {len(acceptable)} finished responses")
+        
+        if not acceptable:
+            return None, last_error
+        
+        rank = {service_type: i for i, service_type in enumerate(services_to_try)}
+        best = min(acceptable, key=lambda r: rank[r.service])
+        for response in acceptable:
+            if response is not best and response.cost_estimate:
+                self._increment_stat('total_cost', response.cost_estimate)
+        return best, None
+    
+    def _call_with_retry(self,
+                         service: BaseTranslationService,
+                         request: TranslationRequest,
+                         attempts: int = 3,
+                         base_delay: float = 0.5) -> TranslationResponse:
+        """
+        Call a service, retrying transient failures with jittered exponential backoff.
+        
+        Services usually report failures as unsuccessful responses rather
+        than exceptions, so both are checked. Only throttling, quota and
+        5xx-style errors are retried; anything else is returned (or raised)
+        straight away so the caller can move on to a fallback service.
+        
+        Every attempt feeds the service's circuit breaker; while it is open
+        the call fails immediately with ``TranslationServiceError``.
+        """
+        key = service.service_type.value
+        for attempt in range(attempts):
+            if self._breaker.is_open(key):
+                raise TranslationServiceError(f"{key} is temporarily disabled after repeated failures")
+            
+            try:
+                response = service.translate(request)
+            except Exception as e:
+                self._breaker.record_failure(key)
+                if attempt == attempts - 1 or not _TRANSIENT_ERROR.search(str(e)):
+                    raise
+                error = str(e)
+            else:
+                if response.success:
+                    self._breaker.record_success(key)
+                else:
+                    self._breaker.record_failure(key)
+                
+                if (response.success or attempt == attempts - 1
+                        or not _TRANSIENT_ERROR.search(response.error or "")):
+                    return response
+                error = response.error
+            
+            delay = base_delay * 2 ** attempt * random.uniform(0.8, 1.2)
+            logger.warning(f"{service.service_type.value} failed transiently ({error}), "
+                           f"retrying in {delay:.2f}s (attempt {attempt + 1}/{attempts})")
+            time.sleep(delay)
+    
     def _is_quality_acceptable(self, response: TranslationResponse) -> bool:
         """Check if translation quality is acceptable."""
         if not response.success:
@@ -360,9 +844,14 @@ class TranslationEngine:
         # Get fallback services
         fallback_services = [s for s in self.fallback_services if s in self.services and s != response.service]
         
+        # Position of each translation in the batch, for replacing it in place
+        index_by_id = {t.request_id: i for i, t in enumerate(response.translations)}
+        
         for service_type in fallback_services:
             if not failed_translations:
                 break  # All failures resolved
+            if self._breaker.is_open(service_type.value):
+                continue
             
             service = self.services[service_type]
             remaining_failures = []
@@ -377,15 +866,14 @@ class TranslationEngine:
                     )
                     
                     # Retry translation
-                    retry_response = service.translate(retry_request)
+                    retry_response = self._call_with_retry(service, retry_request)
                     
                     if retry_response.success and self._is_quality_acceptable(retry_response):
                         # Replace failed translation with successful one
-                        for i, translation in enumerate(response.translations):
-                            if translation.request_id == failed_translation.request_id:
-                                response.translations[i] = retry_response
-                                self.translation_stats['fallback_used'] += 1
-                                break
+                        index = index_by_id.get(failed_translation.request_id)
+                        if index is not None:
+                            response.translations[index] = retry_response
+                            self._increment_stat('fallback_used')
                     else:
                         remaining_failures.append(failed_translation)
                         
@@ -395,35 +883,44 @@ class TranslationEngine:
             
             failed_translations = remaining_failures
         
-        # Recalculate batch metrics
-        response.__post_init__()
-        
-        return response
+        # Rebuild the response so its batch metrics are recalculated
+        return replace(response, translations=response.translations)
+    
+    def _increment_stat(self, name: str, amount: float = 1):
+        """Add to a single counter in the statistics."""
+        with self._stats_lock:
+            self.translation_stats[name] += amount
     
     def _update_stats(self, response: TranslationResponse, service_type: TranslationService, is_fallback: bool):
         """Update translation statistics."""
-        self.translation_stats['total_translations'] += 1
-        
-        if response.success:
-            self.translation_stats['successful_translations'] += 1
+        with self._stats_lock:
+            stats = self.translation_stats
+            stats['total_translations'] += 1
             
-            if response.confidence_score:
-                # Update average quality
-                current_avg = self.translation_stats['average_quality']
-                total = self.translation_stats['successful_translations']
-                self.translation_stats['average_quality'] = ((current_avg * (total - 1)) + response.confidence_score) / total
-        
-        if is_fallback:
-            self.translation_stats['fallback_used'] += 1
-        
-        if response.cost_estimate:
-            self.translation_stats['total_cost'] += response.cost_estimate
-        
-        # Update service usage stats
-        service_key = service_type.value
-        if service_key not in self.translation_stats['service_usage']:
-            self.translation_stats['service_usage'][service_key] = 0
-        self.translation_stats['service_usage'][service_key] += 1
+            if response.success:
+                stats['successful_translations'] += 1
+                
+                if response.confidence_score:
+                    # Update the running mean over translations that reported a score
+                    self._quality_samples += 1
+                    current_avg = stats['average_quality']
+                    stats['average_quality'] = current_avg + (response.confidence_score - current_avg) / self._quality_samples
+            
+            if is_fallback:
+                stats['fallback_used'] += 1
+            
+            if response.cost_estimate:
+                stats['total_cost'] += response.cost_estimate
+            
+            # Update service usage stats
+            service_key = service_type.value
+            stats['service_usage'][service_key] = stats['service_usage'].get(service_key, 0) + 1
+    
+    def close(self):
+        """Shut down the engine's worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
     
     def get_available_services(self) -> List[TranslationService]:
         """Get list of available translation services."""
@@ -437,7 +934,9 @@ class TranslationEngine:
     
     def get_engine_stats(self) -> Dict:
         """Get translation engine statistics."""
-        stats = self.translation_stats.copy()
+        with self._stats_lock:
+            stats = self.translation_stats.copy()
+            stats['service_usage'] = dict(stats['service_usage'])
         stats['available_services'] = [s.value for s in self.get_available_services()]
         stats['default_service'] = self.default_service.value
         stats['quality_threshold'] = self.quality_threshold
@@ -16,6 +16,7 @@ class TranslationService(Enum):
     AZURE_TRANSLATOR = "azure_translator"
     OFFLINE_MODEL = "offline_model"
     MOCK = "mock"  # For testing
+    GLOSSARY = "glossary"  # Built-in phrase lookup; never called as a service
 
 
 class LanguageCode(Enum):
@@ -49,6 +50,7 @@ class TranslationRequest:
     context: Optional[str] = None
     domain: Optional[str] = None  # e.g., 'movie', 'technical', 'casual'
     max_length: Optional[int] = None
+    priority: float = 0.0  # Higher values may be sent to several services at once
     
     # Metadata
     created_at: datetime = field(default_factory=datetime.now)
@@ -372,6 +374,50 @@ LANGUAGE_MAPPINGS = {
 }
 
 
+# Exact translations for short, frequent subtitle lines, keyed by language pair.
+# Phrases are lower-case and without trailing punctuation.
+PHRASE_GLOSSARY = {
+    (LanguageCode.ENGLISH, LanguageCode.SWAHILI): {
+        "yes": "Ndiyo",
+        "no": "Hapana",
+        "ok": "Sawa",
+        "okay": "Sawa",
+        "fine": "Sawa",
+        "hello": "Hujambo",
+        "hi": "Habari",
+        "goodbye": "Kwaheri",
+        "bye": "Kwaheri",
+        "good morning": "Habari za asubuhi",
+        "good night": "Usiku mwema",
+        "welcome": "Karibu",
+        "please": "Tafadhali",
+        "thank you": "Asante",
+        "thanks": "Asante",
+        "thank you very much": "Asante sana",
+        "sorry": "Samahani",
+        "i'm sorry": "Samahani",
+        "excuse me": "Samahani",
+        "i don't know": "Sijui",
+        "really": "Kweli",
+        "of course": "Bila shaka",
+        "wait": "Subiri",
+        "listen": "Sikiliza",
+        "look": "Angalia",
+        "let's go": "Twende",
+        "good luck": "Bahati njema",
+        "congratulations": "Hongera",
+        "i love you": "Nakupenda",
+        "see you later": "Tutaonana baadaye",
+        "what": "Nini",
+        "why": "Kwa nini",
+        "where are you": "Uko wapi",
+        "who are you": "Wewe ni nani",
+        "mom": "Mama",
+        "dad": "Baba"
+    }
+}
+
+
 # Quality thresholds for translation confidence
 QUALITY_THRESHOLDS = {
     "excellent": 0.95,
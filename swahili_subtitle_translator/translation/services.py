@@ -4,18 +4,17 @@ Translation service implementations for different providers.
 
 import time
 import logging
+import threading
+import importlib.util
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Dict, Any
 import json
 import requests
 from datetime import datetime
 
-# Try to import deep-translator
-try:
-    from deep_translator import GoogleTranslator
-    DEEP_TRANSLATOR_AVAILABLE = True
-except ImportError:
-    DEEP_TRANSLATOR_AVAILABLE = False
+# Only probe for deep-translator here; it is imported when a service needs it
+DEEP_TRANSLATOR_AVAILABLE = importlib.util.find_spec('deep_translator') is not None
 
 from .models import (
     TranslationRequest, 
@@ -27,6 +26,8 @@ from .models import (
     LANGUAGE_MAPPINGS
 )
 from ..utils.exceptions import SubtitleTranslatorError
+from ..utils.http import mount_adapter, get_shared_adapter
+from ..utils.rate_limit import TokenBucket
 
 logger = logging.getLogger(__name__)
 
@@ -50,23 +51,34 @@ class BaseTranslationService(ABC):
         self.service_type = service_type
         self.config = kwargs
         self.session = requests.Session()
+        # Keep-alive connections without adapter-level retries; the engine retries
+        mount_adapter(self.session, get_shared_adapter())
         
-        # Rate limiting
+        # Rate limiting: average seconds between requests, with short bursts allowed.
+        # The bucket is thread-safe, so concurrent batch workers share one rate.
         self.rate_limit = kwargs.get('rate_limit', 1.0)
-        self._last_request_time = 0
+        self.rate_limiter = (
+            TokenBucket(rate=1 / self.rate_limit, capacity=kwargs.get('burst', 1))
+            if self.rate_limit > 0 else None
+        )
         
-        # Cost tracking
+        # Cost tracking; batch workers update these from several threads
         self.total_characters_translated = 0
         self.total_cost = 0.0
+        self._totals_lock = threading.Lock()
         
         logger.info(f"Initialized {service_type.value} translation service")
     
+    def _record_usage(self, characters: int, cost: float = 0.0):
+        """Add a finished translation to the running totals."""
+        with self._totals_lock:
+            self.total_characters_translated += characters
+            self.total_cost += cost
+    
     def _rate_limit_wait(self):
         """Enforce rate limiting between requests."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.rate_limit:
-            time.sleep(self.rate_limit - elapsed)
-        self._last_request_time = time.time()
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
     
     def _get_service_language_code(self, language: LanguageCode) -> str:
         """Get service-specific language code."""
@@ -86,46 +98,57 @@ class BaseTranslationService(ABC):
         """
         pass
     
-    def translate_batch(self, request: BatchTranslationRequest) -> BatchTranslationResponse:
+    def translate_batch(self, request: BatchTranslationRequest,
+                        max_workers: int = 1,
+                        translate_fn: Optional[Callable[[TranslationRequest], TranslationResponse]] = None
+                        ) -> BatchTranslationResponse:
         """
         Translate multiple texts in batch.
         
-        Default implementation processes requests sequentially.
-        Services can override for true batch processing.
+        Default implementation translates each text with ``translate``
+        (or ``translate_fn``), one at a time or on a thread pool when
+        ``max_workers`` > 1. Results keep the order of ``request.texts``
+        either way. Services can override for true batch processing.
         
         Args:
             request: Batch translation request
+            max_workers: Maximum number of texts translated concurrently
+            translate_fn: Called instead of ``translate`` for each text,
+                e.g. to add retries around it
             
         Returns:
             Batch translation response
         """
         start_time = time.time()
-        translations = []
+        total = len(request.texts)
         
-        logger.info(f"Starting batch translation of {len(request.texts)} texts")
+        logger.info(f"Starting batch translation of {total} texts")
+        translate = translate_fn or self.translate
         
-        for i, text in enumerate(request.texts):
+        def translate_one(indexed_text) -> TranslationResponse:
+            i, text = indexed_text
+            # Create individual request
+            individual_request = TranslationRequest(
+                text=text,
+                source_language=request.source_language,
+                target_language=request.target_language,
+                preserve_formatting=request.preserve_formatting,
+                context=request.context,
+                domain=request.domain
+            )
+            
             try:
-                # Create individual request
-                individual_request = TranslationRequest(
-                    text=text,
-                    source_language=request.source_language,
-                    target_language=request.target_language,
-                    preserve_formatting=request.preserve_formatting,
-                    context=request.context,
-                    domain=request.domain
-                )
-                
                 # Translate
-                response = self.translate(individual_request)
-                translations.append(response)
+                response = translate(individual_request)
                 
                 if (i + 1) % 10 == 0:  # Log progress every 10 translations
-                    logger.info(f"Completed {i + 1}/{len(request.texts)} translations")
+                    logger.info(f"Completed {i + 1}/{total} translations")
+                return response
                     
             except Exception as e:
+                logger.error(f"Translation failed for text {i}: {e}")
                 # Create error response
-                error_response = TranslationResponse(
+                return TranslationResponse(
                     request_id=individual_request.id,
                     translated_text="",
                     source_text=text,
@@ -135,8 +158,14 @@ class BaseTranslationService(ABC):
                     error=str(e),
                     success=False
                 )
-                translations.append(error_response)
-                logger.error(f"Translation failed for text {i}: {e}")
+        
+        if max_workers > 1 and total > 1:
+            # Network-bound services spend most of each call waiting on I/O
+            with ThreadPoolExecutor(max_workers=min(max_workers, total),
+                                    thread_name_prefix="translate") as executor:
+                translations = list(executor.map(translate_one, enumerate(request.texts)))
+        else:
+            translations = [translate_one(item) for item in enumerate(request.texts)]
         
         processing_time = time.time() - start_time
         
@@ -175,11 +204,17 @@ class GoogleTranslateService(BaseTranslationService):
         Initialize Google Translate service.
         No API key required - uses deep-translator.
         """
+        # The free endpoint tolerates about 5 requests per second
+        kwargs.setdefault('rate_limit', 0.2)
+        kwargs.setdefault('burst', 5)
         super().__init__(TranslationService.GOOGLE_TRANSLATE, **kwargs)
         
         if not DEEP_TRANSLATOR_AVAILABLE:
             raise TranslationServiceError("deep-translator package not available")
         
+        from deep_translator import GoogleTranslator
+        
+        self._translator_class = GoogleTranslator
         self.translator = None
     
     def translate(self, request: TranslationRequest) -> TranslationResponse:
@@ -193,7 +228,7 @@ class GoogleTranslateService(BaseTranslationService):
             target_lang = self._get_service_language_code(request.target_language)
             
             # Create translator instance
-            translator = GoogleTranslator(source=source_lang, target=target_lang)
+            translator = self._translator_class(source=source_lang, target=target_lang)
             
             # Translate text
             translated_text = translator.translate(request.text)
@@ -202,8 +237,7 @@ class GoogleTranslateService(BaseTranslationService):
                 raise TranslationServiceError("Empty translation result")
             
             # Update totals
-            char_count = len(request.text)
-            self.total_characters_translated += char_count
+            self._record_usage(len(request.text))
             
             service_time = time.time() - start_time
             
@@ -314,8 +348,7 @@ class OpenAITranslationService(BaseTranslationService):
                    output_tokens * self.cost_per_output_token)
             
             # Update totals
-            self.total_characters_translated += len(request.text)
-            self.total_cost += cost
+            self._record_usage(len(request.text), cost)
             
             service_time = time.time() - start_time
             
@@ -6,39 +6,70 @@ import json
 import sqlite3
 import hashlib
 import time
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 import logging
 
 from .exceptions import CacheError
 
+# Try to import orjson for faster cache export/import
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+def _dumps(data: Any) -> bytes:
+    """Serialize cache entries to indented UTF-8 JSON."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _loads(data: bytes) -> Any:
+    """Deserialize cache entries from JSON."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class TranslationCache:
     """
     SQLite-based translation cache for storing and retrieving translations.
     
     Features:
-    - Persistent storage using SQLite
+    - Persistent storage using SQLite (WAL journal, one long-lived connection)
+    - In-memory LRU layer in front of the database for reads
+    - Write-behind batching of inserts and usage updates
     - Automatic cleanup of old entries
     - Hash-based key generation
     - Statistics tracking
     """
     
-    def __init__(self, cache_dir: Path, max_age_days: int = 30):
+    def __init__(self, cache_dir: Path, max_age_days: int = 30,
+                 memory_size: int = 65536, flush_interval: int = 100):
         """
         Initialize translation cache.
         
         Args:
             cache_dir: Directory to store cache database
             max_age_days: Maximum age for cache entries in days
+            memory_size: Maximum number of translations kept in memory
+            flush_interval: Number of pending writes that triggers a flush
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
         self.db_path = self.cache_dir / "translations.db"
         self.max_age_days = max_age_days
+        self.memory_size = memory_size
+        self.flush_interval = flush_interval
         
         # Statistics
         self.stats = {
@@ -48,12 +79,28 @@ class TranslationCache:
             'errors': 0
         }
         
+        # In-memory LRU and write-behind buffers
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._pending_writes: Dict[str, Tuple] = {}
+        self._pending_uses: Dict[str, int] = {}
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._batch_depth = 0
+        
         self._init_database()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Get the shared database connection, opening it on first use."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+        return self._conn
         
     def _init_database(self):
         """Initialize the SQLite database."""
         try:
-            with sqlite3.connect(str(self.db_path)) as conn:
+            with self._lock, self._connect() as conn:
                 conn.execute('''
                     CREATE TABLE IF NOT EXISTS translations (
                         key TEXT PRIMARY KEY,
@@ -75,8 +122,6 @@ class TranslationCache:
                     CREATE INDEX IF NOT EXISTS idx_last_used ON translations(last_used)
                 ''')
                 
-                conn.commit()
-                
             logger.debug(f"Cache database initialized: {self.db_path}")
             
         except Exception as e:
@@ -99,31 +144,32 @@ class TranslationCache:
             Translated text if found, None otherwise
         """
         try:
-            with sqlite3.connect(str(self.db_path)) as conn:
-                cursor = conn.execute(
-                    'SELECT translated_text, use_count FROM translations WHERE key = ?',
-                    (key,)
-                )
-                result = cursor.fetchone()
+            with self._lock:
+                translated_text = self._memory.get(key)
                 
-                if result:
-                    translated_text, use_count = result
+                if translated_text is None:
+                    result = self._connect().execute(
+                        'SELECT translated_text FROM translations WHERE key = ?',
+                        (key,)
+                    ).fetchone()
                     
-                    # Update last_used and use_count
-                    current_time = int(time.time())
-                    conn.execute(
-                        'UPDATE translations SET last_used = ?, use_count = ? WHERE key = ?',
-                        (current_time, use_count + 1, key)
-                    )
-                    conn.commit()
+                    if not result:
+                        self.stats['misses'] += 1
+                        logger.debug(f"Cache miss for key: {key[:8]}...")
+                        return None
                     
-                    self.stats['hits'] += 1
-                    logger.debug(f"Cache hit for key: {key[:8]}...")
-                    return translated_text
+                    translated_text = result[0]
+                    self._remember(key, translated_text)
                 else:
-                    self.stats['misses'] += 1
-                    logger.debug(f"Cache miss for key: {key[:8]}...")
-                    return None
+                    self._memory.move_to_end(key)
+                
+                # last_used and use_count are updated on the next flush
+                self._pending_uses[key] = self._pending_uses.get(key, 0) + 1
+                self._flush_if_needed()
+                
+                self.stats['hits'] += 1
+                logger.debug(f"Cache hit for key: {key[:8]}...")
+                return translated_text
                     
         except Exception as e:
             self.stats['errors'] += 1
@@ -145,16 +191,13 @@ class TranslationCache:
         try:
             current_time = int(time.time())
             
-            with sqlite3.connect(str(self.db_path)) as conn:
-                conn.execute('''
-                    INSERT OR REPLACE INTO translations 
-                    (key, source_text, translated_text, source_lang, target_lang, 
-                     created_at, last_used, use_count)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, 1)
-                ''', (key, source_text, translated_text, source_lang, target_lang,
-                      current_time, current_time))
-                
-                conn.commit()
+            with self._lock:
+                self._pending_writes[key] = (key, source_text, translated_text, source_lang,
+                                             target_lang, current_time, current_time)
+                # The insert resets use_count, so earlier hits no longer apply
+                self._pending_uses.pop(key, None)
+                self._remember(key, translated_text)
+                self._flush_if_needed()
                 
             self.stats['saves'] += 1
             logger.debug(f"Cached translation for key: {key[:8]}...")
@@ -163,6 +206,80 @@ class TranslationCache:
             self.stats['errors'] += 1
             logger.error(f"Cache set error: {e}")
     
+    def _remember(self, key: str, translated_text: str):
+        """Add a translation to the in-memory LRU, evicting the oldest entry."""
+        self._memory[key] = translated_text
+        self._memory.move_to_end(key)
+        
+        while len(self._memory) > self.memory_size:
+            evicted, _ = self._memory.popitem(last=False)
+            if evicted in self._pending_writes:
+                # Never drop a translation that is not on disk yet
+                self.flush()
+    
+    def _flush_if_needed(self):
+        """Flush buffered writes once enough of them have accumulated."""
+        if self._batch_depth:
+            return
+        if len(self._pending_writes) + len(self._pending_uses) >= self.flush_interval:
+            self.flush()
+    
+    @contextmanager
+    def batch(self):
+        """
+        Defer flushing until the block exits, then write everything in one
+        transaction.
+        
+        Example:
+            with cache.batch():
+                for key, text in items:
+                    cache.set(key, text)
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self.flush()
+    
+    def flush(self):
+        """Write buffered translations and usage updates to the database."""
+        with self._lock:
+            if not self._pending_writes and not self._pending_uses:
+                return
+            
+            writes = list(self._pending_writes.values())
+            current_time = int(time.time())
+            uses = [(current_time, count, key) for key, count in self._pending_uses.items()]
+            
+            try:
+                with self._connect() as conn:
+                    if writes:
+                        conn.executemany('''
+                            INSERT OR REPLACE INTO translations 
+                            (key, source_text, translated_text, source_lang, target_lang, 
+                             created_at, last_used, use_count)
+                            VALUES (?, ?, ?, ?, ?, ?, ?, 1)
+                        ''', writes)
+                    if uses:
+                        conn.executemany(
+                            'UPDATE translations SET last_used = ?, use_count = use_count + ? WHERE key = ?',
+                            uses
+                        )
+                
+                # Only forget the buffered entries once they are committed
+                self._pending_writes.clear()
+                self._pending_uses.clear()
+                logger.debug(f"Flushed {len(writes)} translations and {len(uses)} usage updates")
+                
+            except Exception as e:
+                # Keep the entries buffered so the next flush retries them
+                self.stats['errors'] += 1
+                logger.error(f"Cache flush error, keeping {len(writes)} translations buffered: {e}")
+    
     def get_by_text(self, source_text: str, source_lang: str = "en", 
                    target_lang: str = "sw") -> Optional[str]:
         """
@@ -198,20 +315,18 @@ class TranslationCache:
         try:
             cutoff_time = int(time.time()) - (self.max_age_days * 24 * 3600)
             
-            with sqlite3.connect(str(self.db_path)) as conn:
-                cursor = conn.execute(
-                    'SELECT COUNT(*) FROM translations WHERE created_at < ?',
-                    (cutoff_time,)
-                )
-                old_count = cursor.fetchone()[0]
-                
-                if old_count > 0:
-                    conn.execute(
+            with self._lock:
+                self.flush()
+                with self._connect() as conn:
+                    cursor = conn.execute(
                         'DELETE FROM translations WHERE created_at < ?',
                         (cutoff_time,)
                     )
-                    conn.commit()
-                    
+                    old_count = cursor.rowcount
+                
+                if old_count > 0:
+                    # Deleted rows may still be held in memory
+                    self._memory.clear()
                     logger.info(f"Cleaned up {old_count} old cache entries")
                 
         except Exception as e:
@@ -220,9 +335,12 @@ class TranslationCache:
     def clear(self):
         """Clear all cache entries."""
         try:
-            with sqlite3.connect(str(self.db_path)) as conn:
-                conn.execute('DELETE FROM translations')
-                conn.commit()
+            with self._lock:
+                self._memory.clear()
+                self._pending_writes.clear()
+                self._pending_uses.clear()
+                with self._connect() as conn:
+                    conn.execute('DELETE FROM translations')
                 
             logger.info("Cache cleared")
             
@@ -233,7 +351,9 @@ class TranslationCache:
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
         try:
-            with sqlite3.connect(str(self.db_path)) as conn:
+            with self._lock:
+                self.flush()
+                conn = self._connect()
                 cursor = conn.execute('SELECT COUNT(*) FROM translations')
                 total_entries = cursor.fetchone()[0]
                 
@@ -285,16 +405,16 @@ class TranslationCache:
             export_path: Path to export file
         """
         try:
-            with sqlite3.connect(str(self.db_path)) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.execute('SELECT * FROM translations')
+            with self._lock:
+                self.flush()
+                cursor = self._connect().execute('SELECT * FROM translations')
+                columns = [column[0] for column in cursor.description]
                 rows = cursor.fetchall()
                 
             # Convert to list of dictionaries
-            data = [dict(row) for row in rows]
+            data = [dict(zip(columns, row)) for row in rows]
             
-            with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            Path(export_path).write_bytes(_dumps(data))
                 
             logger.info(f"Cache exported to {export_path}")
             
@@ -310,23 +430,22 @@ class TranslationCache:
             import_path: Path to import file
         """
         try:
-            with open(import_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _loads(Path(import_path).read_bytes())
                 
-            with sqlite3.connect(str(self.db_path)) as conn:
-                for entry in data:
-                    conn.execute('''
+            with self._lock:
+                self.flush()
+                with self._connect() as conn:
+                    conn.executemany('''
                         INSERT OR REPLACE INTO translations 
                         (key, source_text, translated_text, source_lang, target_lang,
                          created_at, last_used, use_count)
                         VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
+                    ''', [(
                         entry['key'], entry['source_text'], entry['translated_text'],
                         entry['source_lang'], entry['target_lang'],
                         entry['created_at'], entry['last_used'], entry['use_count']
-                    ))
-                
-                conn.commit()
+                    ) for entry in data])
+                self._memory.clear()
                 
             logger.info(f"Cache imported from {import_path}")
             
@@ -335,13 +454,22 @@ class TranslationCache:
             raise CacheError(f"Failed to import cache: {e}")
     
     def save(self):
-        """Save cache to disk (SQLite handles this automatically)."""
-        # SQLite automatically saves to disk, but we can use this for cleanup
+        """Flush buffered writes to disk and remove expired entries."""
+        self.flush()
         self.cleanup_old_entries()
     
+    def close(self):
+        """Flush buffered writes and close the database connection."""
+        with self._lock:
+            self.flush()
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+    
     def __del__(self):
         """Cleanup when cache object is destroyed."""
         try:
             self.save()
+            self.close()
         except:
             pass
@@ -13,6 +13,11 @@ class TranslationError(SubtitleTranslatorError):
     pass
 
 
+class RateLimitError(TranslationError):
+    """Exception raised when a translation service rejects a request for rate limiting."""
+    pass
+
+
 class UnsupportedLanguageError(SubtitleTranslatorError):
     """Exception raised when language is not supported."""
     pass
@@ -0,0 +1,58 @@
+"""
+Shared HTTP adapter helpers for connection reuse.
+"""
+
+import threading
+import logging
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+_shared_adapter: Optional[HTTPAdapter] = None
+_session_lock = threading.Lock()
+
+
+def create_adapter(pool_connections: int = 16, pool_maxsize: int = 16,
+                   retries: int = 0, backoff_factor: float = 0.3) -> HTTPAdapter:
+    """
+    Create a keep-alive HTTP adapter that can be mounted on several sessions.
+
+    Args:
+        pool_connections: Number of hosts to keep connection pools for
+        pool_maxsize: Number of connections kept alive per host
+        retries: Retry attempts for connection-level failures
+        backoff_factor: Backoff factor between retries
+
+    Returns:
+        Configured HTTP adapter
+    """
+    return HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=retries, backoff_factor=backoff_factor)
+    )
+
+
+def mount_adapter(session: requests.Session, adapter: HTTPAdapter) -> None:
+    """Route a session's HTTP and HTTPS traffic through the given adapter."""
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+
+def get_shared_adapter() -> HTTPAdapter:
+    """
+    Get the process-wide keep-alive adapter, creating it on first use.
+
+    Retries are left to the caller, so the adapter never retries on its own.
+    """
+    global _shared_adapter
+
+    if _shared_adapter is None:
+        with _session_lock:
+            if _shared_adapter is None:
+                _shared_adapter = create_adapter(pool_connections=32, pool_maxsize=64)
+    return _shared_adapter
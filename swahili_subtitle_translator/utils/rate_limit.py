@@ -0,0 +1,128 @@
+"""
+Rate limiting helpers for outbound service requests.
+"""
+
+import time
+import logging
+import threading
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+
+    Callers only wait when the bucket is empty, so requests under the
+    configured rate go through without any delay. The refill rate can be
+    adapted to server feedback: ``on_failure`` halves it and ``on_success``
+    raises it additively back towards the configured rate.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0, min_rate: Optional[float] = None):
+        """
+        Initialize token bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens the bucket can hold
+            min_rate: Lowest rate ``on_failure`` may reduce to (default: rate / 8)
+        """
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+
+        self.rate = rate
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate) if min_rate else rate / 8
+        self.capacity = max(capacity, 1.0)
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Add tokens for the time elapsed since the last refill (lock held)."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens from the bucket, sleeping until they are available.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Time spent waiting in seconds
+        """
+        with self._lock:
+            self._refill()
+
+            # Reserve the tokens now so concurrent callers queue up behind us
+            self._tokens -= tokens
+            wait_time = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait_time > 0:
+            time.sleep(wait_time)
+        return wait_time
+
+    def limit_rate(self, rate: float) -> None:
+        """Lower the configured rate if ``rate`` is stricter; never raises it."""
+        with self._lock:
+            if rate >= self.max_rate:
+                return
+            self._refill()
+            self.max_rate = rate
+            self.rate = min(self.rate, rate)
+            self.min_rate = min(self.min_rate, rate / 8)
+
+    def on_failure(self) -> None:
+        """Halve the refill rate after the server pushes back."""
+        with self._lock:
+            self._refill()
+            self.rate = max(self.min_rate, self.rate / 2)
+
+    def on_success(self) -> None:
+        """Raise the refill rate by a tenth of the configured rate."""
+        if self.rate >= self.max_rate:
+            return
+        with self._lock:
+            self._refill()
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+
+
+class CircuitBreaker:
+    """
+    Tracks consecutive failures per key (host, service, ...) and skips keys
+    that keep failing.
+
+    After ``threshold`` failures in a row a key is skipped for ``cooldown``
+    seconds. Once the cooldown ends requests are let through again, and a
+    single further failure re-opens the circuit until a success resets it.
+    """
+
+    def __init__(self, threshold: int, cooldown: float):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._failures: Dict[str, int] = {}
+        self._open_until: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def is_open(self, key: str) -> bool:
+        """Check whether requests for a key are currently being skipped."""
+        return self._open_until.get(key, 0.0) > time.monotonic()
+
+    def record_success(self, key: str):
+        if key in self._failures:
+            with self._lock:
+                self._failures.pop(key, None)
+                self._open_until.pop(key, None)
+
+    def record_failure(self, key: str):
+        with self._lock:
+            failures = self._failures.get(key, 0) + 1
+            self._failures[key] = failures
+            if failures >= self.threshold:
+                self._open_until[key] = time.monotonic() + self.cooldown
+                logger.warning(f"{key} failed {failures} times in a row, skipping it for {self.cooldown:.0f}s")
@@ -4,6 +4,8 @@ Basic test script to verify the new subtitle translator works.
 """
 
 import sys
+import sqlite3
+import tempfile
 from pathlib import Path
 
 # Add the package to Python path
@@ -11,6 +13,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from swahili_subtitle_translator.core.translator import SubtitleTranslator
 from swahili_subtitle_translator.core.processor import SubtitleProcessor
+from swahili_subtitle_translator.utils.cache import TranslationCache
 
 def test_basic_translation():
     """Test basic translation functionality."""
@@ -91,6 +94,132 @@ The night is dark and full of terrors.
             test_file.unlink()
             print("🧹 Cleaned up test file")
 
+def test_no_cache_bypasses_memory_cache():
+    """Test that a translator with caching disabled always calls the service."""
+    print("\n🚫 Testing translation with caching disabled...")
+    
+    class CountingService:
+        calls = 0
+        
+        def translate(self, text):
+            self.calls += 1
+            return f"sw {text}"
+    
+    translator = SubtitleTranslator(enable_cache=False)
+    service = CountingService()
+    translator.services = {'google': service}
+    translator._service_order = ('google',)
+    translator.stats['service_usage'] = {'google': 0}
+    
+    for _ in range(3):
+        assert translator.translate_text("Where are you going?") == "sw Where are you going?"
+    
+    print(f"   Service calls: {service.calls}")
+    assert service.calls == 3
+    assert translator.get_stats()['cache_hits'] == 0
+    print("   ✅ Every call reached the service")
+
+
+def test_sentence_batch_keeps_alignment():
+    """Test that line breaks inside sentences don't shift batched translations."""
+    print("\n📝 Testing sentence batching with multi-line cues...")
+    
+    class LineService:
+        def translate(self, text):
+            return "\n".join(f"sw[{line}]" for line in text.split("\n"))
+    
+    translator = SubtitleTranslator(enable_cache=False)
+    translator.services = {'google': LineService()}
+    translator._service_order = ('google',)
+    translator.stats['service_usage'] = {'google': 0}
+    
+    sentences = ["Stay here,\nand wait for me.", "I will be back soon."]
+    translated = translator._translate_sentences(sentences)
+    
+    print(f"   Translated: {translated}")
+    assert translated == ["sw[Stay here, and wait for me.]", "sw[I will be back soon.]"]
+    print("   ✅ Each sentence kept its own translation")
+
+
+def test_cache_lru_and_write_behind():
+    """Test the translation cache's in-memory LRU and write-behind flushing."""
+    print("\n💾 Testing translation cache...")
+    
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = TranslationCache(Path(cache_dir), memory_size=2, flush_interval=100)
+        
+        def rows_on_disk():
+            with sqlite3.connect(str(cache.db_path)) as conn:
+                return conn.execute('SELECT COUNT(*) FROM translations').fetchone()[0]
+        
+        # Writes are buffered until something forces a flush
+        cache.set("a", "moja")
+        cache.set("b", "mbili")
+        assert rows_on_disk() == 0
+        
+        # Evicting an unflushed entry writes it out instead of losing it
+        cache.set("c", "tatu")
+        assert list(cache._memory) == ["b", "c"]
+        assert rows_on_disk() == 3
+        assert cache.get("a") == "moja"
+        assert list(cache._memory) == ["c", "a"]
+        
+        # Batches are written in one go when the block exits
+        with cache.batch():
+            cache.set("d", "nne")
+            cache.set("e", "tano")
+            assert rows_on_disk() == 3
+        assert rows_on_disk() == 5
+        
+        # Hits are counted on disk after the next flush
+        cache.get("e")
+        cache.flush()
+        with sqlite3.connect(str(cache.db_path)) as conn:
+            use_count = conn.execute('SELECT use_count FROM translations WHERE key = ?', ("e",)).fetchone()[0]
+        assert use_count == 2
+        
+        cache.close()
+    
+    print("   ✅ LRU eviction and write-behind flushing work")
+
+def test_cache_durability():
+    """Test that cached translations reach disk without relying on cleanup."""
+    print("\n🔒 Testing translation cache durability...")
+    
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = TranslationCache(Path(cache_dir))
+        
+        # A failed flush keeps its entries for the next attempt
+        cache.set("a", "moja")
+        cache._connect().close()
+        cache.flush()
+        assert cache.stats['errors'] == 1
+        assert "a" in cache._pending_writes
+        
+        cache._conn = None
+        cache.flush()
+        assert not cache._pending_writes
+        with sqlite3.connect(str(cache.db_path)) as conn:
+            assert conn.execute('SELECT translated_text FROM translations').fetchall() == [("moja",)]
+        cache.close()
+        
+        # A standalone translate_text call writes its result before returning
+        class EchoService:
+            def translate(self, text):
+                return f"sw {text}"
+        
+        translator = SubtitleTranslator(cache_dir=Path(cache_dir) / "translator")
+        translator.services = {'google': EchoService()}
+        translator._service_order = ('google',)
+        translator.stats['service_usage'] = {'google': 0}
+        translator.translate_text("Close the door.")
+        
+        with sqlite3.connect(str(translator.cache.db_path)) as conn:
+            assert conn.execute('SELECT COUNT(*) FROM translations').fetchone()[0] == 1
+        translator.cache.close()
+    
+    print("   ✅ Translations are flushed and failed flushes are retried")
+
 if __name__ == "__main__":
     print("🚀 Swahili Subtitle Translator - Basic Tests")
     print("=" * 50)
@@ -98,6 +227,10 @@ if __name__ == "__main__":
     try:
         test_basic_translation()
         test_subtitle_creation()
+        test_no_cache_bypasses_memory_cache()
+        test_sentence_batch_keeps_alignment()
+        test_cache_lru_and_write_behind()
+        test_cache_durability()
         print("\n🎉 All basic tests completed!")
         
     except Exception as e:
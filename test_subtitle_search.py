@@ -4,7 +4,10 @@ Test script for subtitle search functionality.
 """
 
 import sys
+import time
+import asyncio
 import logging
+import threading
 from pathlib import Path
 
 # Add the project to Python path
@@ -12,7 +15,8 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 from swahili_subtitle_translator.search.engine import SubtitleSearchEngine, search_subtitles
-from swahili_subtitle_translator.search.models import SearchQuery, SourceType
+from swahili_subtitle_translator.search.models import SearchQuery, SearchResult, SourceType, SubtitleFormat
+from swahili_subtitle_translator.search.sources import SubtitleSource, SubtitleSourceError
 
 # Set up logging
 logging.basicConfig(
@@ -196,6 +200,196 @@ def test_download_simulation(engine):
         return False
 
 
+def test_opensubtitles_row_parsing():
+    """Test that the streaming and BeautifulSoup OpenSubtitles parsers agree."""
+    print("\n" + "="*60)
+    print("Testing OpenSubtitles Result Parsing")
+    print("="*60)
+    
+    from swahili_subtitle_translator.search.sources import OpenSubtitlesSource
+    
+    rows = "".join(
+        f'<tr id="name{i}"><td><a href="/en/subtitles/{i}/movie">Movie {i}</a></td>'
+        f'<td class="MovieRelease">Movie.{i}.1080p</td>'
+        f'<td><a href="/en/subtitleserve/sub/{i}">Download</a></td></tr>'
+        for i in range(5)
+    )
+    page = f'<html><body><table><tr><th>Header</th></tr>{rows}</table></body></html>'.encode()
+    
+    class StreamedPage:
+        headers = {'content-type': 'text/html; charset=utf-8'}
+        encoding = 'utf-8'
+        
+        def iter_content(self, chunk_size):
+            for start in range(0, len(page), 64):
+                yield page[start:start + 64]
+    
+    source = OpenSubtitlesSource()
+    query = SearchQuery(title="Movie", limit=3)
+    
+    streamed = source._parse_search_stream(StreamedPage(), query)
+    fallback = source._parse_search_results(page, query, 'utf-8')
+    
+    summary = lambda results: [(r.title, r.download_url, r.release_info) for r in results]
+    print(f"✓ Streaming parser found {len(streamed)} rows, fallback found {len(fallback)}")
+    
+    assert len(streamed) == 3
+    assert summary(streamed) == summary(fallback)
+    assert streamed[0].title == "Movie 0"
+    assert streamed[0].release_info == "Movie.0.1080p"
+    assert streamed[0].download_url == "https://www.opensubtitles.org/en/subtitleserve/sub/0"
+    return True
+
+
+class ScriptedSource(SubtitleSource):
+    """Offline source that returns canned results after a fixed delay."""
+    
+    requires_session_warmup = False
+    shares_host_quota = False
+    
+    def __init__(self, source_type, count=3, delay=0.0, fail=False):
+        super().__init__(base_url="https://example.invalid", name=f"Scripted {source_type.value}")
+        self.source_type = source_type
+        self.count = count
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self._calls_lock = threading.Lock()
+    
+    def search(self, query):
+        with self._calls_lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        if self.fail:
+            raise SubtitleSourceError(f"{self.name} is down")
+        return [
+            SearchResult(
+                id=f"{self.source_type.value}-{i}",
+                title=f"{query.title} {self.source_type.value} {i}",
+                year=query.year,
+                language=query.language,
+                format=SubtitleFormat.SRT,
+                source=self.source_type,
+                download_url=f"https://example.invalid/{self.source_type.value}/{i}"
+            )
+            for i in range(self.count)
+        ]
+    
+    def download_subtitle(self, result, output_path):
+        raise SubtitleSourceError("Scripted sources cannot download")
+
+
+def _engine_with_sources(sources, **kwargs):
+    """Build a search engine whose sources are the given scripted ones."""
+    engine = SubtitleSearchEngine(**kwargs)
+    engine.sources = {source.source_type: source for source in sources}
+    return engine
+
+
+def test_early_stop_respects_priority():
+    """Test that parallel search waits for sources that could outrank the results so far."""
+    print("\n" + "="*60)
+    print("Testing Priority-Aware Early Stop")
+    print("="*60)
+    
+    # Subscene fills the limit first, but OpenSubtitles ranks above it
+    subscene = ScriptedSource(SourceType.SUBSCENE, count=10)
+    opensubtitles = ScriptedSource(SourceType.OPENSUBTITLES, count=3, delay=0.3)
+    mock = ScriptedSource(SourceType.MOCK, count=5, delay=3.0)
+    engine = _engine_with_sources([subscene, opensubtitles, mock])
+    
+    try:
+        started = time.monotonic()
+        results = engine.search(SearchQuery(title="Priority", limit=5))
+        elapsed = time.monotonic() - started
+    finally:
+        engine.close()
+    
+    sources = [r.source for r in results]
+    print(f"✓ Got {sources} in {elapsed:.2f}s")
+    
+    assert sources == [SourceType.OPENSUBTITLES] * 3 + [SourceType.SUBSCENE] * 2
+    # The lower-priority mock source was skipped rather than awaited
+    assert elapsed < 2.0
+    # Skipping a source leaves the results incomplete, so they are not cached
+    assert not engine._result_cache
+    return True
+
+
+def test_partial_results_not_cached():
+    """Test that searches missing a failed or timed-out source are not cached."""
+    print("\n" + "="*60)
+    print("Testing Partial Search Caching")
+    print("="*60)
+    
+    query = SearchQuery(title="Partial", limit=10)
+    
+    def run(search, failing_source):
+        engine = _engine_with_sources(
+            [ScriptedSource(SourceType.SUBSCENE, count=2), failing_source],
+            timeout_per_source=0.2
+        )
+        try:
+            results = search(engine)
+        finally:
+            engine.close()
+        return results, dict(engine._result_cache)
+    
+    scenarios = {
+        "search, timed out": (lambda engine: engine.search(query),
+                              ScriptedSource(SourceType.YIFY, delay=1.0)),
+        "search, failed": (lambda engine: engine.search(query),
+                           ScriptedSource(SourceType.YIFY, fail=True)),
+        "sequential search, failed": (lambda engine: engine.search(query, parallel=False),
+                                      ScriptedSource(SourceType.YIFY, fail=True)),
+        "asearch, timed out": (lambda engine: asyncio.run(engine.asearch(query)),
+                               ScriptedSource(SourceType.YIFY, delay=1.0)),
+        "asearch, failed": (lambda engine: asyncio.run(engine.asearch(query)),
+                            ScriptedSource(SourceType.YIFY, fail=True)),
+    }
+    for name, (search, failing_source) in scenarios.items():
+        results, cached = run(search, failing_source)
+        print(f"✓ {name}: {len(results)} results, {len(cached)} cached")
+        assert [r.source for r in results] == [SourceType.SUBSCENE] * 2
+        assert not cached
+    
+    # A search where every source answers is cached
+    results, cached = run(lambda engine: engine.search(query),
+                          ScriptedSource(SourceType.YIFY, count=1))
+    assert len(results) == 3
+    assert len(cached) == 1
+    return True
+
+
+def test_concurrent_queries_coalesced():
+    """Test that identical concurrent searches against a source run only once."""
+    print("\n" + "="*60)
+    print("Testing Concurrent Query Coalescing")
+    print("="*60)
+    
+    source = ScriptedSource(SourceType.SUBSCENE, count=2, delay=0.3)
+    query = SearchQuery(title="Coalesced")
+    results = []
+    
+    def worker():
+        results.append(source.cached_search(query))
+    
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    print(f"✓ {len(results)} callers, {source.calls} search(es) made")
+    
+    assert source.calls == 1
+    assert len(results) == 8
+    assert all(r == results[0] for r in results)
+    # Callers get their own lists, so mutating one leaves the others intact
+    assert len({id(r) for r in results}) == 8
+    return True
+
+
 def main():
     """Run all tests."""
     print("Swahili Subtitle Translator - Search Engine Tests")
@@ -227,6 +421,22 @@ def main():
     download_ok = test_download_simulation(engine)
     test_results.append(("Download Simulation", download_ok))
     
+    # Test 6: Result page parsing
+    parsing_ok = test_opensubtitles_row_parsing()
+    test_results.append(("Result Parsing", parsing_ok))
+    
+    # Test 7: Priority-aware early stop
+    early_stop_ok = test_early_stop_respects_priority()
+    test_results.append(("Priority-Aware Early Stop", early_stop_ok))
+    
+    # Test 8: Partial results are not cached
+    partial_ok = test_partial_results_not_cached()
+    test_results.append(("Partial Search Caching", partial_ok))
+    
+    # Test 9: Identical concurrent queries are coalesced
+    coalesced_ok = test_concurrent_queries_coalesced()
+    test_results.append(("Query Coalescing", coalesced_ok))
+    
     # Summary
     print("\n" + "="*60)
     print("TEST SUMMARY")
@@ -18,7 +18,7 @@ from swahili_subtitle_translator.translation import (
     SubtitleEntry, SubtitleFile,
     
     # Services
-    create_translation_service, translate_text,
+    BaseTranslationService, create_translation_service, translate_text,
     
     # Engine
     TranslationEngine, create_translation_engine, translate_simple,
@@ -384,6 +384,154 @@ def test_convenience_functions():
         return False
 
 
+class ScriptedGoogleService(BaseTranslationService):
+    """Stand-in for Google Translate that can be switched between up and down."""
+    
+    def __init__(self):
+        super().__init__(TranslationService.GOOGLE_TRANSLATE, rate_limit=0)
+        self.healthy = True
+        self.calls = 0
+    
+    def translate(self, request: TranslationRequest) -> TranslationResponse:
+        self.calls += 1
+        if not self.healthy:
+            return TranslationResponse(
+                request_id=request.id,
+                translated_text="",
+                source_text=request.text,
+                source_language=request.source_language,
+                target_language=request.target_language,
+                service=self.service_type,
+                error="Connection refused",
+                success=False
+            )
+        return TranslationResponse(
+            request_id=request.id,
+            translated_text=f"sw: {request.text}",
+            source_text=request.text,
+            source_language=request.source_language,
+            target_language=request.target_language,
+            service=self.service_type,
+            confidence_score=0.85
+        )
+
+
+def _engine_with_scripted_google(**kwargs):
+    """Create an engine whose primary service is a ScriptedGoogleService."""
+    engine = TranslationEngine(fallback_services=[TranslationService.MOCK], **kwargs)
+    google = ScriptedGoogleService()
+    engine.services[TranslationService.GOOGLE_TRANSLATE] = google
+    engine.default_service = TranslationService.GOOGLE_TRANSLATE
+    return engine, google
+
+
+def test_result_cache_skips_fallback_output():
+    """Test that fallback translations are not served from the result cache."""
+    print("\n" + "="*60)
+    print("Testing Result Cache With Fallbacks")
+    print("="*60)
+    
+    engine, google = _engine_with_scripted_google()
+    text = "Where did you leave the car keys?"
+    
+    # Primary down: the mock placeholder is returned but not remembered
+    google.healthy = False
+    response = engine.translate(text)
+    print(f"  Outage: '{response.translated_text}' from {response.service.value}")
+    assert response.success and response.service == TranslationService.MOCK
+    
+    # Primary back: the real translation is returned and cached
+    google.healthy = True
+    response = engine.translate(text)
+    print(f"  Recovered: '{response.translated_text}' from {response.service.value}")
+    assert response.service == TranslationService.GOOGLE_TRANSLATE
+    assert response.translated_text == f"sw: {text}"
+    
+    calls = google.calls
+    total = engine.get_engine_stats()['total_translations']
+    assert engine.translate(text).translated_text == f"sw: {text}"
+    assert google.calls == calls, "repeat should be served from the cache"
+    stats = engine.get_engine_stats()
+    assert stats['cache_hits'] == 1
+    assert stats['total_translations'] == total + 1
+    
+    # Disabling fallbacks is a different request
+    engine.translate(text, use_fallbacks=False)
+    assert google.calls == calls + 1
+    
+    print("✓ Only primary-service translations are cached")
+    return True
+
+
+def test_circuit_breaker():
+    """Test that a failing service is skipped in single and batch translation."""
+    print("\n" + "="*60)
+    print("Testing Service Circuit Breaker")
+    print("="*60)
+    
+    # Batch: the breaker opens part-way and the rest of the batch skips the service
+    engine, google = _engine_with_scripted_google(max_concurrency=1)
+    google.healthy = False
+    texts = [f"Line number {i} of the film" for i in range(8)]
+    batch_response = engine.translate_batch(texts)
+    print(f"  Batch during outage: {google.calls} calls to the primary for {len(texts)} texts")
+    assert google.calls == 5
+    assert batch_response.successful_translations == len(texts)
+    assert all(t.service == TranslationService.MOCK for t in batch_response.translations)
+    
+    # Single translations skip the open service too
+    response = engine.translate("Somebody call a doctor")
+    assert google.calls == 5
+    assert response.service == TranslationService.MOCK
+    
+    # Single: failures from translate open the breaker for later batches
+    engine, google = _engine_with_scripted_google()
+    google.healthy = False
+    for i in range(5):
+        engine.translate(f"Sentence number {i} goes here")
+    calls = google.calls
+    batch_response = engine.translate_batch(["The ship has sailed", "We leave at dawn"])
+    print(f"  Batch after single failures: {google.calls - calls} calls to the primary")
+    assert google.calls == calls
+    assert batch_response.service == TranslationService.MOCK
+    assert batch_response.successful_translations == 2
+    
+    print("✓ Open circuits are skipped")
+    return True
+
+
+def test_batch_glossary_positions():
+    """Test that glossary phrases keep their place among service translations."""
+    print("\n" + "="*60)
+    print("Testing Glossary Hits In Batches")
+    print("="*60)
+    
+    engine = TranslationEngine(default_service=TranslationService.MOCK)
+    texts = ["Where is the station?", "Thank you.", "It has been raining all day", "Hello", "Goodbye!"]
+    batch_response = engine.translate_batch(texts)
+    
+    for translation in batch_response.translations:
+        print(f"  '{translation.source_text}' -> '{translation.translated_text}'")
+    
+    assert [t.source_text for t in batch_response.translations] == texts
+    assert batch_response.translations[1].translated_text == "Asante."
+    assert batch_response.translations[3].translated_text == "Hujambo"
+    assert batch_response.translations[4].translated_text == "Kwaheri!"
+    assert batch_response.total_texts == len(texts)
+    assert batch_response.successful_translations == len(texts)
+    assert batch_response.translations[1].service == TranslationService.GLOSSARY
+    assert engine.get_engine_stats()['glossary_hits'] == 3
+    
+    # A pinned service translates every text itself
+    pinned = engine.translate_batch(texts, preferred_service=TranslationService.MOCK)
+    assert all(t.service == TranslationService.MOCK for t in pinned.translations)
+    assert engine.translate("Thank you.", preferred_service=TranslationService.MOCK).service == TranslationService.MOCK
+    assert engine.get_engine_stats()['glossary_hits'] == 3
+    
+    print("✓ Glossary hits are merged back in order")
+    return True
+
+
 def main():
     """Run all translation pipeline tests."""
     print("🌍 Swahili Subtitle Translator - Translation Pipeline Tests")
@@ -400,7 +548,10 @@ def main():
         ("Translation Engine", test_translation_engine),
         ("Subtitle Parsing", test_subtitle_parsing),
         ("Complete Pipeline", test_complete_translation_pipeline),
-        ("Convenience Functions", test_convenience_functions)
+        ("Convenience Functions", test_convenience_functions),
+        ("Result Cache Fallbacks", test_result_cache_skips_fallback_output),
+        ("Circuit Breaker", test_circuit_breaker),
+        ("Batch Glossary Positions", test_batch_glossary_positions)
     ]
     
     for test_name, test_func in tests: